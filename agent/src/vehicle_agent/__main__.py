@@ -17,14 +17,23 @@ def main() -> None:
     """Launch the Vehicle AI Agent server."""
     config = get_config()
 
-    log_level = config.agent_log_level.lower()
+    log_level = config.log_level_lower
     logger.info("Starting Vehicle AI Agent on port 8000")
 
+    # uvicorn.run() (not Server.run()) is what dispatches to the
+    # Multiprocess supervisor when workers > 1, so the worker count from
+    # config only takes effect through this entry point.
     uvicorn.run(
         "vehicle_agent.main:app",
         host="0.0.0.0",
         port=8000,
         log_level=log_level,
+        loop="uvloop",
+        http="httptools",
+        workers=config.uvicorn_workers,
+        backlog=4096,
+        limit_concurrency=config.max_concurrent_requests,
+        timeout_keep_alive=75,
     )
 
 
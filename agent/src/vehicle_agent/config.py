@@ -4,10 +4,15 @@ Loads settings from environment variables with sensible defaults.
 Uses pydantic-settings for validation and type coercion.
 """
 
-from functools import lru_cache
+import logging
+from functools import cached_property
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+# Name → numeric level mapping, resolved once at import time.
+_LEVEL_NAMES: dict[str, int] = logging.getLevelNamesMapping()
+
 
 class AgentConfig(BaseSettings):
     """Application configuration loaded from environment variables.
@@ -22,6 +27,10 @@ class AgentConfig(BaseSettings):
         mcp_server_cwd: Working directory for the MCP server subprocess.
         agent_log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         max_tool_calls_per_turn: Maximum tool invocations per single user turn.
+        mcp_tools_cache_ttl_seconds: Seconds before the MCP tool-list cache
+            is refreshed from the server.
+        uvicorn_workers: Number of uvicorn worker processes to run.
+        max_concurrent_requests: Concurrency limit before uvicorn sheds load.
     """
 
     gemini_api_key: str = ""
@@ -33,6 +42,9 @@ class AgentConfig(BaseSettings):
     mcp_server_cwd: str | None = None
     agent_log_level: str = "INFO"
     max_tool_calls_per_turn: int = 10
+    mcp_tools_cache_ttl_seconds: float = 3600.0
+    uvicorn_workers: int = 1
+    max_concurrent_requests: int = 256
 
     model_config = {
         "env_prefix": "",
@@ -42,12 +54,70 @@ class AgentConfig(BaseSettings):
         "extra": "ignore",
     }
 
+    @field_validator("agent_log_level")
+    @classmethod
+    def _normalise_log_level(cls, value: str) -> str:
+        """Upper-case and validate the log level at config-load time.
+
+        Args:
+            value: Raw log level string from the environment.
+
+        Returns:
+            Upper-cased log level name.
+
+        Raises:
+            ValueError: If the name is not a known logging level.
+        """
+        upper = value.upper()
+        if upper not in _LEVEL_NAMES:
+            raise ValueError(f"Unknown log level: {value!r}")
+        return upper
+
+    @property
+    def log_level_int(self) -> int:
+        """Numeric logging level for ``logging.basicConfig``."""
+        return _LEVEL_NAMES[self.agent_log_level]
+
+    @property
+    def log_level_lower(self) -> str:
+        """Lower-cased level name as expected by uvicorn."""
+        return self.agent_log_level.lower()
+
+    @cached_property
+    def mcp_server_args_str(self) -> str:
+        """Space-joined server args, built once for log formatting."""
+        return " ".join(self.mcp_server_args)
+
+    @cached_property
+    def kuksa_databroker_port_str(self) -> str:
+        """Databroker port as a string, built once for env overlays."""
+        return str(self.kuksa_databroker_port)
+
+
+# Loaded configuration singleton; None until the first get_config() call.
+_CONFIG_SINGLETON: AgentConfig | None = None
+
 
-@lru_cache(maxsize=1)
 def get_config() -> AgentConfig:
     """Get the application configuration singleton.
 
+    The config is immutable after startup, so after the first call this
+    is a plain module-global read with none of the lru_cache lock and
+    key-lookup overhead.
+
     Returns:
         Cached AgentConfig instance loaded from environment.
     """
-    return AgentConfig()
+    global _CONFIG_SINGLETON  # noqa: PLW0603
+    if _CONFIG_SINGLETON is None:
+        _CONFIG_SINGLETON = AgentConfig()
+    return _CONFIG_SINGLETON
+
+
+def reset_config() -> None:
+    """Discard the cached config so the next get_config() reloads it.
+
+    Intended for tests that need a fresh environment read.
+    """
+    global _CONFIG_SINGLETON  # noqa: PLW0603
+    _CONFIG_SINGLETON = None
@@ -8,17 +8,20 @@ Yields streaming events for real-time UI updates.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from google import genai
 from google.genai import types
 
 from vehicle_agent.config import AgentConfig
 from vehicle_agent.mcp_bridge import McpBridge
 from vehicle_agent.prompts import SYSTEM_PROMPT
+from vehicle_agent.schemas import ChatMessage
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,51 @@ EVENT_TEXT_CHUNK = "text_chunk"
 EVENT_ERROR = "error"
 EVENT_DONE = "done"
 
+# Recently seen tool-error payloads, keyed by message. During an MCP
+# outage the same error fires for every call, so serialize it once.
+_ERROR_CACHE: dict[str, str] = {}
+_ERROR_CACHE_MAX = 128
+
+# Upper bound on cached sessions per agent. Session ids are client
+# supplied, so without a cap a client could grow server memory without
+# limit by inventing fresh ids; least-recently-used sessions are evicted
+# once the cap is reached.
+_SESSION_CACHE_MAX = 256
+
+
+def _error_result(message: str) -> str:
+    """Return the JSON tool-result payload for an error *message*.
+
+    Args:
+        message: Human-readable error description.
+
+    Returns:
+        JSON string of the form ``{"error": "..."}``.
+    """
+    cached = _ERROR_CACHE.get(message)
+    if cached is None:
+        cached = orjson.dumps({"error": message}).decode()
+        if len(_ERROR_CACHE) < _ERROR_CACHE_MAX:
+            _ERROR_CACHE[message] = cached
+    return cached
+
+
+@lru_cache(maxsize=4)
+def _get_genai_client(api_key: str) -> genai.Client:
+    """Return a shared genai.Client for *api_key*.
+
+    Client construction sets up auth and an HTTP connection pool, so one
+    client per key is shared across agent instances to keep connections
+    to the Gemini endpoint alive process-wide.
+
+    Args:
+        api_key: Gemini API key.
+
+    Returns:
+        Cached genai.Client instance.
+    """
+    return genai.Client(api_key=api_key)
+
 
 class VehicleAgent:
     """Gemini 2.0 Flash agent with MCP tool calling for vehicle diagnostics.
@@ -53,57 +101,111 @@ class VehicleAgent:
         """
         self._mcp_bridge = mcp_bridge
         self._config = config
-        self._client = genai.Client(api_key=config.gemini_api_key)
+        self._client = _get_genai_client(config.gemini_api_key)
+        self._aio = self._client.aio
+        self._gen_config = self._build_gen_config()
+        # LRU-ordered session cache: most recently used session last.
+        self._session_contents: OrderedDict[str, list[types.Content]] = OrderedDict()
+
+    def invalidate_tools(self) -> None:
+        """Rebuild the cached generation config after an MCP tool reload."""
+        self._gen_config = self._build_gen_config()
+
+    def _build_gen_config(self) -> types.GenerateContentConfig:
+        """Build the generation config from the bridge's tool declarations.
+
+        Tool declarations are static for the lifetime of the MCP
+        connection, so the Gemini Tool and GenerateContentConfig objects
+        are constructed once here instead of on every turn.
+
+        Returns:
+            GenerateContentConfig with tools and system instruction set.
+        """
+        declarations = self._mcp_bridge.get_gemini_tool_declarations()
+        return types.GenerateContentConfig(
+            tools=[types.Tool(function_declarations=declarations)],
+            system_instruction=SYSTEM_PROMPT,
+        )
 
     async def chat(
         self,
         message: str,
-        history: list[dict[str, str]],
+        history: list[ChatMessage],
+        session_id: str | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Process a user message and yield streaming agent events.
 
         Executes a ReAct loop:
         1. Build conversation contents from history + new message
-        2. Call Gemini with tool declarations
+        2. Stream Gemini response chunks, yielding text_chunk events
+           as text arrives
         3. If function_call parts: execute tools, yield events, continue
-        4. If text parts: yield text_chunk + done events, break
+        4. Otherwise the streamed text was the final answer: yield done
 
         Args:
             message: The new user message.
-            history: Prior conversation turns (role + content dicts).
+            history: Prior conversation turns as ChatMessage models.
+            session_id: Optional session key. When provided, the Gemini
+                Content history is cached server-side and only the new
+                turn is converted per request.
 
         Yields:
             AgentEvent-compatible dicts with type and payload fields.
         """
-        contents = _build_contents(history, message)
-        declarations = self._mcp_bridge.get_gemini_tool_declarations()
+        contents = self._resolve_contents(message, history, session_id)
 
         for turn in range(self._config.max_tool_calls_per_turn):
             logger.info("Agent turn %d/%d", turn + 1, self._config.max_tool_calls_per_turn)
 
+            function_calls: list[types.FunctionCall] = []
+            call_contents: list[types.Content] = []
+            text_parts: list[str] = []
+            saw_candidate = False
+
             try:
-                response = await self._generate(contents, declarations)
+                stream = await self._generate(contents)
+                async for chunk in stream:
+                    candidate = _extract_candidate(chunk)
+                    if candidate is None:
+                        continue
+                    saw_candidate = True
+
+                    calls, text = _split_parts(candidate)
+                    if calls:
+                        function_calls.extend(calls)
+                        call_contents.append(candidate.content)
+                    if text:
+                        text_parts.append(text)
+                        yield _text_event(text)
             except Exception as exc:
                 logger.error("Gemini API error: %s", exc)
                 yield _error_event(f"Gemini API error: {exc}")
                 yield _done_event()
                 return
 
-            candidate = _extract_candidate(response)
-            if candidate is None:
+            if not saw_candidate:
                 yield _error_event("No response from Gemini")
                 yield _done_event()
                 return
 
-            function_calls = _extract_function_calls(candidate)
-
             if not function_calls:
-                async for event in self._handle_text_response(candidate):
-                    yield event
+                if session_id is not None:
+                    if text_parts:
+                        contents.append(
+                            types.Content(
+                                role="model",
+                                parts=[types.Part.from_text(text="".join(text_parts))],
+                            ),
+                        )
+                    # The cache is only updated once the turn completes, so
+                    # a concurrent request on the same session never sees a
+                    # half-built history.
+                    self._store_session(session_id, contents)
+                yield _done_event()
                 return
 
             async for event in self._handle_tool_calls(
-                contents, candidate, function_calls,
+                contents, call_contents, function_calls,
             ):
                 yield event
 
@@ -112,54 +214,88 @@ class VehicleAgent:
         )
         yield _done_event()
 
-    async def _generate(
+    def _resolve_contents(
         self,
-        contents: list[types.Content],
-        declarations: list[dict[str, Any]],
-    ) -> types.GenerateContentResponse:
-        """Call the Gemini API with tool declarations.
+        message: str,
+        history: list[ChatMessage],
+        session_id: str | None,
+    ) -> list[types.Content]:
+        """Fetch or build the Gemini contents for this request.
+
+        On a session-cache hit only the new user message is converted to
+        a Content object; the cached list already holds every prior turn
+        (including model and tool turns appended during earlier runs).
+        Without a session id, or on a miss, the full history is rebuilt.
 
         Args:
-            contents: Conversation history as Gemini Content objects.
-            declarations: Gemini function declarations from MCP tools.
+            message: The new user message.
+            history: Prior conversation turns as ChatMessage models.
+            session_id: Optional session cache key.
+
+        The returned list is always private to this request: on a cache
+        hit the cached history is copied, not returned directly, so two
+        concurrent requests on the same session cannot interleave their
+        in-progress turns. The cache itself is only updated by
+        ``_store_session`` when a turn completes.
 
         Returns:
-            The Gemini generation response.
+            Mutable list of Gemini Content objects for this conversation.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._client.models.generate_content(
-                model=self._config.gemini_model,
-                contents=contents,
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(function_declarations=declarations)],
-                    system_instruction=SYSTEM_PROMPT,
-                ),
-            ),
-        )
+        if session_id is not None:
+            cached = self._session_contents.get(session_id)
+            if cached is not None:
+                self._session_contents.move_to_end(session_id)
+                return [
+                    *cached,
+                    types.Content(
+                        role="user",
+                        parts=[types.Part.from_text(text=message)],
+                    ),
+                ]
+
+        return _build_contents(history, message)
+
+    def _store_session(
+        self,
+        session_id: str,
+        contents: list[types.Content],
+    ) -> None:
+        """Store a completed turn's contents in the session cache.
+
+        Marks the session most recently used and evicts the least
+        recently used sessions beyond ``_SESSION_CACHE_MAX``.
 
-    async def _handle_text_response(
+        Args:
+            session_id: Session cache key.
+            contents: Full conversation contents after the turn.
+        """
+        self._session_contents[session_id] = contents
+        self._session_contents.move_to_end(session_id)
+        while len(self._session_contents) > _SESSION_CACHE_MAX:
+            self._session_contents.popitem(last=False)
+
+    async def _generate(
         self,
-        candidate: types.Candidate,
-    ) -> AsyncGenerator[dict[str, Any], None]:
-        """Yield text_chunk and done events from a text response.
+        contents: list[types.Content],
+    ) -> AsyncGenerator[types.GenerateContentResponse, None]:
+        """Call the streaming Gemini API with the cached tool config.
 
         Args:
-            candidate: Gemini response candidate containing text parts.
+            contents: Conversation history as Gemini Content objects.
 
-        Yields:
-            text_chunk events for each text part, then a done event.
+        Returns:
+            Async iterator of streamed Gemini response chunks.
         """
-        text = _extract_text(candidate)
-        if text:
-            yield _text_event(text)
-        yield _done_event()
+        return await self._aio.models.generate_content_stream(
+            model=self._config.gemini_model,
+            contents=contents,
+            config=self._gen_config,
+        )
 
     async def _handle_tool_calls(
         self,
         contents: list[types.Content],
-        candidate: types.Candidate,
+        call_contents: list[types.Content],
         function_calls: list[types.FunctionCall],
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Execute tool calls and append results to the conversation.
@@ -169,26 +305,38 @@ class VehicleAgent:
 
         Args:
             contents: Mutable conversation contents list.
-            candidate: The candidate that produced the function calls.
+            call_contents: Streamed model contents carrying function_call parts.
             function_calls: Extracted function call parts.
 
         Yields:
             tool_call and tool_result events for each function call.
         """
         # Append the model's response (with function_call parts) to history
-        contents.append(candidate.content)
-
-        function_responses: list[types.Part] = []
+        contents.extend(call_contents)
 
         for fc in function_calls:
-            args = dict(fc.args) if fc.args else {}
-            yield _tool_call_event(fc.name, args)
+            # The event payload must be a plain JSON-serializable dict;
+            # the bridge itself accepts the proto mapping as-is.
+            yield _tool_call_event(fc.name, dict(fc.args) if fc.args else {})
+
+        # Independent tool calls run concurrently; wall time is bounded by
+        # the slowest tool instead of the sum of all round trips.
+        results = await asyncio.gather(
+            *(
+                self._mcp_bridge.call_tool(fc.name, fc.args or {})
+                for fc in function_calls
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                result_text = await self._mcp_bridge.call_tool(fc.name, args)
-            except Exception as exc:
-                logger.error("Tool '%s' execution failed: %s", fc.name, exc)
-                result_text = json.dumps({"error": str(exc)})
+        function_responses: list[types.Part] = []
+
+        for fc, result in zip(function_calls, results):
+            if isinstance(result, BaseException):
+                logger.error("Tool '%s' execution failed: %s", fc.name, result)
+                result_text = _error_result(str(result))
+            else:
+                result_text = result
 
             yield _tool_result_event(fc.name, result_text)
 
@@ -207,13 +355,13 @@ class VehicleAgent:
 # Content building helpers
 # ---------------------------------------------------------------------------
 def _build_contents(
-    history: list[dict[str, str]],
+    history: list[ChatMessage],
     message: str,
 ) -> list[types.Content]:
     """Build Gemini conversation contents from history and new message.
 
     Args:
-        history: Prior conversation turns with ``role`` and ``content``.
+        history: Prior conversation turns as ChatMessage models.
         message: The new user message.
 
     Returns:
@@ -222,13 +370,11 @@ def _build_contents(
     contents: list[types.Content] = []
 
     for turn in history:
-        role = turn.get("role", "user")
-        text = turn.get("content", "")
-        gemini_role = "model" if role == "assistant" else "user"
+        gemini_role = "model" if turn.role == "assistant" else "user"
         contents.append(
             types.Content(
                 role=gemini_role,
-                parts=[types.Part.from_text(text=text)],
+                parts=[types.Part.from_text(text=turn.content)],
             ),
         )
 
@@ -261,23 +407,40 @@ def _extract_candidate(
     return response.candidates[0]
 
 
-def _extract_function_calls(
+def _split_parts(
     candidate: types.Candidate,
-) -> list[types.FunctionCall]:
-    """Extract all function_call parts from a candidate.
+) -> tuple[list[types.FunctionCall], str]:
+    """Split a candidate's parts into function calls and text in one pass.
 
     Args:
         candidate: Gemini response candidate.
 
     Returns:
-        List of FunctionCall objects found in the candidate's parts.
+        Tuple of (function calls, concatenated text).
     """
     calls: list[types.FunctionCall] = []
+    texts: list[str] = []
     if candidate.content and candidate.content.parts:
         for part in candidate.content.parts:
             if part.function_call is not None:
                 calls.append(part.function_call)
-    return calls
+            elif part.text:
+                texts.append(part.text)
+    return calls, "".join(texts)
+
+
+def _extract_function_calls(
+    candidate: types.Candidate,
+) -> list[types.FunctionCall]:
+    """Extract all function_call parts from a candidate.
+
+    Args:
+        candidate: Gemini response candidate.
+
+    Returns:
+        List of FunctionCall objects found in the candidate's parts.
+    """
+    return _split_parts(candidate)[0]
 
 
 def _extract_text(candidate: types.Candidate) -> str:
@@ -289,12 +452,7 @@ def _extract_text(candidate: types.Candidate) -> str:
     Returns:
         Combined text from all text parts.
     """
-    texts: list[str] = []
-    if candidate.content and candidate.content.parts:
-        for part in candidate.content.parts:
-            if part.text:
-                texts.append(part.text)
-    return "".join(texts)
+    return _split_parts(candidate)[1]
 
 
 # ---------------------------------------------------------------------------
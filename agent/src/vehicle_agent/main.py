@@ -7,19 +7,21 @@ streamed via Server-Sent Events (SSE) for real-time UI updates.
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse, StreamingResponse
+import orjson
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.responses import StreamingResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from vehicle_agent.config import AgentConfig, get_config
 from vehicle_agent.gemini_agent import VehicleAgent
 from vehicle_agent.mcp_bridge import McpBridge
-from vehicle_agent.schemas import ChatRequest, HealthResponse
+from vehicle_agent.schemas import ChatMessage, ChatRequest
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +55,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     _config = get_config()
 
     logging.basicConfig(
-        level=getattr(logging, _config.agent_log_level.upper(), logging.INFO),
+        level=_config.log_level_int,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
@@ -82,6 +84,67 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             logger.info("MCP bridge disconnected at shutdown")
 
 
+# ---------------------------------------------------------------------------
+# CORS middleware
+# ---------------------------------------------------------------------------
+_CORS_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST"),
+    (b"access-control-allow-headers", b"Content-Type"),
+]
+
+
+class CORSASGIMiddleware:
+    """Minimal pure-ASGI CORS layer for the wildcard-origin dashboard policy.
+
+    The policy here is trivial (``*`` origin, no credentials), so a tiny
+    in-line ASGI wrapper suffices: preflight OPTIONS requests are answered
+    directly and every other HTTP response gets the allow-origin header
+    appended on ``http.response.start``. No per-request task or response
+    buffering is involved, which keeps SSE chunks flushing immediately.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap *app* with CORS handling.
+
+        Args:
+            app: Downstream ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection, injecting CORS headers for HTTP.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": list(_CORS_HEADERS),
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"access-control-allow-origin", b"*"))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
 # ---------------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------------
@@ -90,43 +153,64 @@ app = FastAPI(
     version="0.1.0",
     description="Gemini-powered vehicle diagnostics agent via MCP",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(CORSASGIMiddleware)
+
+# Compress sizeable JSON responses. SSE must be excluded explicitly:
+# GZipMiddleware does compress streaming responses, and relying on
+# text/event-stream being in Starlette's default exclusion list would
+# let a future pin change silently start gzip-buffering the chat stream.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["GET", "POST"],
-    allow_headers=["Content-Type"],
+    GZipMiddleware,
+    minimum_size=1024,
+    exclude_content_types=("text/event-stream",),
 )
 
 
+# ---------------------------------------------------------------------------
+# Dependencies
+# ---------------------------------------------------------------------------
+def require_agent() -> VehicleAgent:
+    """Resolve the configured VehicleAgent or fail with 503.
+
+    Returns:
+        The initialised VehicleAgent singleton.
+
+    Raises:
+        HTTPException: 503 if no agent is available (missing API key or
+            startup not completed).
+    """
+    if _agent is None:
+        raise HTTPException(
+            status_code=503,
+            detail="GEMINI_API_KEY not configured",
+        )
+    return _agent
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 @app.post("/api/chat", response_model=None)
-async def chat(request: ChatRequest) -> StreamingResponse | JSONResponse:
+async def chat(
+    request: ChatRequest,
+    agent: VehicleAgent = Depends(require_agent),
+) -> StreamingResponse:
     """Process a user chat message and stream agent events via SSE.
 
     Returns 503 if the Gemini API key is not configured.
 
     Args:
         request: Chat request with user message and conversation history.
+        agent: Configured agent resolved by the require_agent dependency.
 
     Returns:
-        StreamingResponse with ``text/event-stream`` media type,
-        or a 503 JSONResponse if the agent is unavailable.
+        StreamingResponse with ``text/event-stream`` media type.
     """
-    if _agent is None or _config is None or not _config.gemini_api_key:
-        return JSONResponse(
-            status_code=503,
-            content={"error": "GEMINI_API_KEY not configured"},
-        )
-
-    history = [msg.model_dump() for msg in request.history]
-
     return StreamingResponse(
-        _event_stream(request.message, history),
+        _event_stream(agent, request.message, request.history, request.session_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -136,46 +220,72 @@ async def chat(request: ChatRequest) -> StreamingResponse | JSONResponse:
     )
 
 
-@app.get("/api/health")
-async def health() -> HealthResponse:
+@app.get("/api/health", response_model=None)
+async def health() -> ORJSONResponse:
     """Return the current health status of the agent server.
 
+    The payload mirrors the HealthResponse schema but is encoded
+    directly — the fields are built here from known-good values, so a
+    second FastAPI validation pass would only burn CPU under
+    load-balancer polling.
+
     Returns:
-        HealthResponse with MCP connection and Gemini configuration status.
+        ORJSONResponse with MCP connection and Gemini configuration status.
     """
-    return HealthResponse(
-        status="ok",
-        mcp_connected=_mcp_bridge.is_connected if _mcp_bridge else False,
-        gemini_configured=bool(_config and _config.gemini_api_key),
+    return ORJSONResponse(
+        {
+            "status": "ok",
+            "mcp_connected": _mcp_bridge.is_connected if _mcp_bridge else False,
+            "gemini_configured": bool(_config and _config.gemini_api_key),
+        },
     )
 
 
 # ---------------------------------------------------------------------------
 # SSE stream helper
 # ---------------------------------------------------------------------------
+# SSE framing bytes and the constant done sentinel: every agent turn ends
+# with the same {"type": "done"} payload, so it is serialized once here.
+# text_chunk is the high-frequency event while the LLM streams; only its
+# content varies, so the envelope is a pre-built byte template.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_DONE_SSE = b'data: {"type":"done"}\n\n'
+_TEXT_CHUNK_TPL = b'data: {"type":"text_chunk","content":%b}\n\n'
+
+
 async def _event_stream(
+    agent: VehicleAgent,
     message: str,
-    history: list[dict[str, str]],
-) -> AsyncGenerator[str, None]:
-    """Generate SSE-formatted event strings from agent output.
+    history: list[ChatMessage],
+    session_id: str | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Generate SSE-formatted event byte strings from agent output.
 
     Each event is encoded as ``data: <json>\\n\\n`` following the SSE spec.
+    Serialization uses orjson, which emits bytes directly — no intermediate
+    str round-trip before the StreamingResponse sends the chunk.
 
     Args:
+        agent: Agent instance resolved by the endpoint dependency.
         message: User message to process.
-        history: Conversation history as list of role/content dicts.
+        history: Conversation history as ChatMessage models.
+        session_id: Optional session key for server-side history caching.
 
     Yields:
-        SSE-formatted strings for each agent event.
+        SSE-formatted byte strings for each agent event.
     """
-    assert _agent is not None  # guarded by caller
-
     try:
-        async for event in _agent.chat(message, history):
-            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+        async for event in agent.chat(message, history, session_id):
+            event_type = event["type"]
+            if event_type == "text_chunk":
+                yield _TEXT_CHUNK_TPL % orjson.dumps(event["content"])
+            elif event_type == "done":
+                yield _DONE_SSE
+            else:
+                yield _SSE_PREFIX + orjson.dumps(event) + _SSE_SUFFIX
     except Exception as exc:
         logger.error("Error during chat stream: %s", exc, exc_info=True)
         error_event = {"type": "error", "message": str(exc)}
-        yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
-        done_event = {"type": "done"}
-        yield f"data: {json.dumps(done_event)}\n\n"
+        yield _SSE_PREFIX + orjson.dumps(error_event) + _SSE_SUFFIX
+        yield _DONE_SSE
@@ -10,8 +10,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 from mcp import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.types import Tool as McpTool
@@ -25,18 +29,42 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 TOOL_CACHE_KEY = "_cached_tools"
 
+# Subset of JSON Schema keys the Gemini function-declaration API accepts,
+# hoisted to module scope so schema cleaning allocates no per-call set.
+_ALLOWED_KEYS: frozenset[str] = frozenset(
+    {"type", "description", "enum", "items", "properties", "required"}
+)
+
+# Shared read-only schema for tools that declare no parameters. "No
+# schema" is the common case across the tool catalog, so one immutable
+# singleton replaces two fresh dicts per tool per conversion. Compares
+# equal to the literal dict, and the proxy guards against accidental
+# mutation of the shared object.
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType(
+    {"type": "object", "properties": MappingProxyType({})}
+)
+
+# Read-only tools whose concurrent duplicate calls can safely share one
+# MCP round-trip; writes like set_actuator must never be coalesced.
+_IDEMPOTENT_TOOLS: frozenset[str] = frozenset(
+    {
+        "get_vehicle_signal",
+        "get_multiple_signals",
+        "diagnose_dtc",
+        "search_vss_tree",
+    }
+)
+
 
 class McpBridgeError(Exception):
     """Raised when the MCP bridge encounters an unrecoverable error."""
 
-    def __init__(self, detail: str = "MCP bridge error") -> None:
-        """Initialise with a human-readable error detail.
+    __slots__ = ()
 
-        Args:
-            detail: Description of the bridge failure.
-        """
-        self.detail = detail
-        super().__init__(detail)
+    @property
+    def detail(self) -> str:
+        """Human-readable error detail, backed by the exception args."""
+        return str(self.args[0]) if self.args else "MCP bridge error"
 
 
 class McpBridge:
@@ -50,6 +78,22 @@ class McpBridge:
         config: Agent configuration with MCP server launch parameters.
     """
 
+    # Slots keep per-bridge memory flat and make the attribute set explicit;
+    # the bridge is a long-lived singleton, so this mostly guards against
+    # typo'd attribute writes.
+    __slots__ = (
+        "_config",
+        "_session",
+        "_tools_cache",
+        "_tools_cached_at",
+        "_gemini_declarations_cache",
+        "_background_task",
+        "is_connected",
+        "_ready",
+        "_env_cache",
+        "_inflight",
+    )
+
     def __init__(self, config: AgentConfig) -> None:
         """Initialise the bridge with agent configuration.
 
@@ -60,13 +104,15 @@ class McpBridge:
         self._config = config
         self._session: ClientSession | None = None
         self._tools_cache: list[McpTool] | None = None
+        self._tools_cached_at: float | None = None
+        self._gemini_declarations_cache: list[dict[str, Any]] | None = None
         self._background_task: asyncio.Task[None] | None = None
-        self._connected = False
-
-    @property
-    def is_connected(self) -> bool:
-        """Whether the MCP session is active and the subprocess is alive."""
-        return self._connected and self._session is not None
+        # Plain bool instead of a property: the health endpoint reads this
+        # on every poll, and the flag only flips on session transitions.
+        self.is_connected: bool = False
+        self._ready = asyncio.Event()
+        self._env_cache: dict[str, str] | None = None
+        self._inflight: dict[tuple[str, bytes], asyncio.Future[str]] = {}
 
     async def connect(self) -> None:
         """Launch kuksa_mcp.server as subprocess and initialise MCP session.
@@ -79,7 +125,7 @@ class McpBridge:
             McpBridgeError: If the subprocess cannot be started or the
                 MCP handshake fails.
         """
-        if self._connected:
+        if self.is_connected:
             logger.warning("McpBridge.connect() called but already connected")
             return
 
@@ -94,7 +140,7 @@ class McpBridge:
         logger.info(
             "Launching MCP server subprocess: %s %s (cwd=%s)",
             self._config.mcp_server_command,
-            " ".join(self._config.mcp_server_args),
+            self._config.mcp_server_args_str,
             self._config.mcp_server_cwd or "(inherited)",
         )
 
@@ -102,24 +148,23 @@ class McpBridge:
             self._run_session(server_params),
         )
 
-        # Wait briefly for the session to initialise
-        for _ in range(50):
-            if self._connected:
-                break
-            await asyncio.sleep(0.1)
-
-        if not self._connected:
+        # Wake up the moment _run_session signals readiness instead of
+        # polling _connected on a 100ms tick.
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=5.0)
+        except TimeoutError:
             raise McpBridgeError(
                 "MCP server subprocess failed to initialise within 5 seconds"
-            )
+            ) from None
 
         logger.info("MCP bridge connected successfully")
 
     async def disconnect(self) -> None:
         """Clean shutdown of the MCP session and subprocess."""
-        self._connected = False
+        self.is_connected = False
         self._session = None
-        self._tools_cache = None
+        self.invalidate_tools()
+        self._ready.clear()
 
         if self._background_task is not None and not self._background_task.done():
             self._background_task.cancel()
@@ -131,8 +176,22 @@ class McpBridge:
 
         logger.info("MCP bridge disconnected")
 
+    def invalidate_tools(self) -> None:
+        """Drop the tool-list and declaration caches.
+
+        The next ``list_tools`` call re-queries the MCP server. Intended
+        for ``tools/list_changed`` notifications or server restarts.
+        """
+        self._tools_cache = None
+        self._tools_cached_at = None
+        self._gemini_declarations_cache = None
+
     async def list_tools(self) -> list[McpTool]:
-        """Return available MCP tools, using cache after first call.
+        """Return available MCP tools, using a TTL'd cache after first call.
+
+        The cache is considered stale after ``mcp_tools_cache_ttl_seconds``
+        so catalog changes in a restarted MCP server are picked up without
+        tearing the bridge down; ``invalidate_tools`` busts it explicitly.
 
         Returns:
             List of MCP tool definitions.
@@ -142,60 +201,191 @@ class McpBridge:
         """
         self._ensure_session()
 
-        if self._tools_cache is not None:
+        if (
+            self._tools_cache is not None
+            and self._tools_cached_at is not None
+            and time.monotonic() - self._tools_cached_at
+            < self._config.mcp_tools_cache_ttl_seconds
+        ):
             return self._tools_cache
 
         assert self._session is not None  # guarded by _ensure_session
         result = await self._session.list_tools()
         self._tools_cache = list(result.tools)
-
-        logger.info(
-            "Cached %d MCP tools: %s",
-            len(self._tools_cache),
-            [t.name for t in self._tools_cache],
+        self._tools_cached_at = time.monotonic()
+        # Convert once at cache-fill time so each Gemini turn reads the
+        # pre-built declarations instead of re-walking every tool schema.
+        # map() runs the loop in C and presizes the result list.
+        self._gemini_declarations_cache = list(
+            map(_mcp_tool_to_gemini_declaration, self._tools_cache)
         )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cached %d MCP tools: %s",
+                len(self._tools_cache),
+                [t.name for t in self._tools_cache],
+            )
         return self._tools_cache
 
-    async def call_tool(self, name: str, arguments: dict[str, Any]) -> str:
+    async def call_tool(self, name: str, arguments: Mapping[str, Any]) -> str:
         """Call an MCP tool and return the text result.
 
+        Concurrent duplicate calls to idempotent read tools (same name and
+        arguments) are coalesced onto one in-flight MCP round-trip; each
+        waiter receives the shared result. The round-trip runs as a
+        shielded task, so one waiter's cancellation (e.g. its client
+        disconnecting) never aborts the call for the others.
+
         Args:
             name: MCP tool name (e.g. ``get_vehicle_signal``).
-            arguments: Tool arguments as a dictionary.
+            arguments: Tool arguments as a mapping; any Mapping works, so
+                callers need not copy proto maps into plain dicts.
 
         Returns:
             Concatenated text content from the tool response.
 
+        Raises:
+            McpBridgeError: If not connected or the tool call fails.
+        """
+        if name not in _IDEMPOTENT_TOOLS:
+            return await self._dispatch_tool(name, arguments)
+
+        key = (name, _canonical_args(arguments))
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.get_running_loop().create_task(
+                self._dispatch_tool(name, arguments)
+            )
+            self._inflight[key] = pending
+
+            def _cleanup(task: asyncio.Task[str], key: tuple[str, bytes] = key) -> None:
+                self._inflight.pop(key, None)
+                if not task.cancelled():
+                    task.exception()  # mark retrieved even with no waiters
+            pending.add_done_callback(_cleanup)
+        else:
+            logger.debug("Coalescing duplicate in-flight call to '%s'", name)
+
+        # shield: cancelling this caller (client disconnect) must not
+        # cancel the shared round-trip out from under the other waiters.
+        return await asyncio.shield(pending)
+
+    async def call_tool_bytes(
+        self, name: str, arguments: Mapping[str, Any]
+    ) -> bytes:
+        """Call an MCP tool and return the UTF-8 encoded text result.
+
+        Callers that forward the result onto a byte-oriented transport
+        (SSE frames, outbound request bodies) can consume this directly
+        and skip the str round-trip that ``call_tool`` performs.
+
+        Cancellation is cooperative: when an HTTP client disconnects,
+        Starlette cancels the streaming task and the CancelledError
+        propagates into the awaited session call, aborting the MCP
+        round-trip instead of letting it run to completion.
+
+        Args:
+            name: MCP tool name.
+            arguments: Tool arguments mapping.
+
+        Returns:
+            Newline-joined UTF-8 bytes of the tool's text content.
+
         Raises:
             McpBridgeError: If not connected or the tool call fails.
         """
         self._ensure_session()
         assert self._session is not None  # guarded by _ensure_session
 
-        logger.info("Calling MCP tool '%s' with args: %s", name, arguments)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calling MCP tool '%s' with args: %s", name, _args_repr(arguments)
+            )
 
         try:
             result = await self._session.call_tool(name, arguments)
+        except asyncio.CancelledError:
+            logger.debug("MCP tool '%s' cancelled before completion", name)
+            raise
         except Exception as exc:
             raise McpBridgeError(
                 f"MCP tool '{name}' failed: {exc}"
             ) from exc
 
-        text_parts = [
-            part.text for part in result.content
-            if hasattr(part, "text") and part.text
-        ]
-        response_text = "\n".join(text_parts) if text_parts else ""
+        response = b"\n".join(
+            text.encode("utf-8")
+            for part in result.content
+            if (text := getattr(part, "text", ""))
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MCP tool '%s' returned: %s", name, response[:200])
+        return response
+
+    async def _dispatch_tool(self, name: str, arguments: Mapping[str, Any]) -> str:
+        """Issue a single MCP tool call and decode the text result.
+
+        Args:
+            name: MCP tool name.
+            arguments: Tool arguments mapping.
+
+        Returns:
+            Concatenated text content from the tool response.
+
+        Raises:
+            McpBridgeError: If not connected or the tool call fails.
+        """
+        return (await self.call_tool_bytes(name, arguments)).decode("utf-8")
+
+    async def call_tools(
+        self, calls: list[tuple[str, Mapping[str, Any]]]
+    ) -> list[str]:
+        """Call several independent MCP tools concurrently.
+
+        Dispatches every call in one ``asyncio.gather`` so N independent
+        invocations cost roughly one round-trip over the stdio transport
+        instead of N sequential ones.
+
+        Args:
+            calls: (tool name, arguments) pairs to dispatch together.
+
+        Returns:
+            Text results in the same order as ``calls``.
+
+        Raises:
+            McpBridgeError: If not connected or any tool call fails; the
+                error names the first failing tool.
+        """
+        self._ensure_session()
+        assert self._session is not None  # guarded by _ensure_session
+
+        if not calls:
+            return []
+
+        logger.info("Calling %d MCP tools concurrently", len(calls))
 
-        logger.debug("MCP tool '%s' returned: %s", name, response_text[:200])
-        return response_text
+        results = await asyncio.gather(
+            *(self._session.call_tool(name, args) for name, args in calls),
+            return_exceptions=True,
+        )
+
+        texts: list[str] = []
+        for (name, _args), result in zip(calls, results):
+            if isinstance(result, BaseException):
+                raise McpBridgeError(
+                    f"MCP tool '{name}' failed: {result}"
+                ) from result
+            texts.append(_join_text(result))
+        return texts
 
     def get_gemini_tool_declarations(self) -> list[dict[str, Any]]:
         """Convert cached MCP tool schemas to Gemini function declarations.
 
         Each MCP tool carries ``name``, ``description``, and ``inputSchema``
-        (JSON Schema). This method transforms them into the format expected
-        by the Gemini ``function_declarations`` API.
+        (JSON Schema). The conversion to the Gemini ``function_declarations``
+        format happens once when the tool cache is filled; subsequent calls
+        return the memoized list.
 
         Returns:
             List of Gemini-compatible function declaration dicts.
@@ -208,12 +398,14 @@ class McpBridge:
                 "Tools not cached; call list_tools() first"
             )
 
-        declarations: list[dict[str, Any]] = []
-        for tool in self._tools_cache:
-            declaration = _mcp_tool_to_gemini_declaration(tool)
-            declarations.append(declaration)
+        if self._gemini_declarations_cache is None:
+            # Tools were cached without going through list_tools()
+            # (e.g. injected in tests); convert them once here.
+            self._gemini_declarations_cache = list(
+                map(_mcp_tool_to_gemini_declaration, self._tools_cache)
+            )
 
-        return declarations
+        return self._gemini_declarations_cache
 
     # -- Internal helpers ---------------------------------------------------
 
@@ -223,27 +415,38 @@ class McpBridge:
         Raises:
             McpBridgeError: If the session is not connected.
         """
-        if not self._connected or self._session is None:
+        if not self.is_connected or self._session is None:
             raise McpBridgeError("MCP bridge is not connected")
 
     def _build_subprocess_env(self) -> dict[str, str]:
         """Build environment variables for the MCP server subprocess.
 
         Passes Kuksa connection parameters so the child process can
-        reach the Databroker.
+        reach the Databroker. The dict is built once per bridge -- the
+        config is immutable, so reconnects reuse the cached copy instead
+        of re-copying the full ``os.environ``.
 
         Returns:
             Environment variable dictionary.
         """
-        env = dict(os.environ)
-        env["KUKSA_DATABROKER_HOST"] = self._config.kuksa_databroker_host
-        env["KUKSA_DATABROKER_PORT"] = str(self._config.kuksa_databroker_port)
-        return env
+        if self._env_cache is None:
+            # PEP 448 merge builds the overlaid dict in one sized allocation
+            # instead of copy-then-assign.
+            self._env_cache = {
+                **os.environ,
+                "KUKSA_DATABROKER_HOST": self._config.kuksa_databroker_host,
+                "KUKSA_DATABROKER_PORT": self._config.kuksa_databroker_port_str,
+            }
+        return self._env_cache
 
     async def _run_session(self, server_params: StdioServerParameters) -> None:
         """Run the MCP stdio client session as a long-lived background task.
 
         Keeps the context managers alive for the lifetime of the bridge.
+        ``stdio_client`` spawns the server via ``anyio.open_process``,
+        which on asyncio is ``create_subprocess_exec`` -- the fork/exec is
+        loop-integrated, so startup never blocks the serving event loop
+        on a synchronous ``Popen``.
 
         Args:
             server_params: Parameters for launching the MCP server subprocess.
@@ -253,10 +456,11 @@ class McpBridge:
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
                     self._session = session
-                    self._connected = True
+                    self.is_connected = True
 
                     logger.info("MCP session initialised, caching tools")
                     await self.list_tools()
+                    self._ready.set()
 
                     # Block until cancelled to keep context managers alive
                     try:
@@ -268,13 +472,58 @@ class McpBridge:
         except Exception:
             logger.error("MCP session failed unexpectedly", exc_info=True)
         finally:
-            self._connected = False
+            self.is_connected = False
             self._session = None
+            self._ready.clear()
 
 
 # ---------------------------------------------------------------------------
 # Module-level helpers
 # ---------------------------------------------------------------------------
+def _canonical_args(arguments: Mapping[str, Any]) -> bytes:
+    """Serialize tool arguments to canonical sorted-key JSON bytes.
+
+    Args:
+        arguments: Tool arguments mapping.
+
+    Returns:
+        orjson-encoded bytes with sorted keys, stable across dict order.
+    """
+    return orjson.dumps(dict(arguments), option=orjson.OPT_SORT_KEYS)
+
+
+def _args_repr(arguments: Mapping[str, Any]) -> str:
+    """Render tool arguments as compact JSON for log lines.
+
+    orjson is markedly faster than ``dict.__repr__`` and the output is
+    valid JSON, so logged argument lines can be pasted straight into
+    tooling.
+
+    Args:
+        arguments: Tool arguments mapping.
+
+    Returns:
+        Canonical JSON string form of the arguments.
+    """
+    return _canonical_args(arguments).decode()
+
+
+def _join_text(result: Any) -> str:
+    """Concatenate the text content blocks of an MCP tool result.
+
+    Args:
+        result: ``CallToolResult`` returned by the MCP session.
+
+    Returns:
+        Newline-joined text of all non-empty text blocks, or ``""``.
+    """
+    # getattr with a default replaces the hasattr try/except probe, and
+    # feeding the generator straight to join skips the intermediate list.
+    return "\n".join(
+        text for part in result.content if (text := getattr(part, "text", ""))
+    )
+
+
 def _mcp_tool_to_gemini_declaration(tool: McpTool) -> dict[str, Any]:
     """Convert a single MCP tool definition to a Gemini function declaration.
 
@@ -296,27 +545,37 @@ def _mcp_tool_to_gemini_declaration(tool: McpTool) -> dict[str, Any]:
 
 def _extract_parameters_schema(
     input_schema: dict[str, Any] | None,
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """Extract a clean parameters schema from an MCP inputSchema.
 
     Strips keys not recognised by the Gemini API while preserving
     the essential ``type``, ``properties``, and ``required`` fields.
+    Schemaless tools share the read-only ``_EMPTY_PARAMS`` singleton;
+    callers treat the result as read-only either way.
 
     Args:
         input_schema: JSON Schema from the MCP tool definition.
 
     Returns:
-        Cleaned parameters dict suitable for Gemini.
+        Cleaned parameters mapping suitable for Gemini.
     """
     if not input_schema:
-        return {"type": "object", "properties": {}}
+        return _EMPTY_PARAMS
 
     properties = input_schema.get("properties", {})
     required = input_schema.get("required", [])
 
-    cleaned_properties: dict[str, Any] = {}
-    for prop_name, prop_schema in properties.items():
-        cleaned_properties[prop_name] = _clean_property_schema(prop_schema)
+    # Local alias skips the per-property global lookup in the comprehension.
+    clean = _clean_property_schema
+    cleaned_properties: dict[str, Any] = {
+        prop_name: clean(prop_schema)
+        for prop_name, prop_schema in properties.items()
+    }
+
+    # A schema that declares an empty properties object lands on the same
+    # shape as "no schema at all"; reuse the shared singleton for it too.
+    if not cleaned_properties and not required:
+        return _EMPTY_PARAMS
 
     result: dict[str, Any] = {
         "type": "object",
@@ -340,22 +599,34 @@ def _clean_property_schema(prop_schema: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Cleaned property schema dict.
     """
-    allowed_keys = {"type", "description", "enum", "items", "properties", "required"}
-    cleaned: dict[str, Any] = {}
-
-    for key, value in prop_schema.items():
-        if key in allowed_keys:
-            cleaned[key] = value
+    # Most real tool properties are already minimal ({"type": ...} plus a
+    # description); when every key is allowed and a concrete type is
+    # present, cleaning would rebuild an identical dict, so return the
+    # original. Callers treat property schemas as read-only. Union keys
+    # cannot slip through -- anyOf/oneOf are not in _ALLOWED_KEYS.
+    if "type" in prop_schema and prop_schema.keys() <= _ALLOWED_KEYS:
+        return prop_schema
+
+    # keys() & frozenset runs the filter in C; only the surviving keys are
+    # then fetched, instead of testing membership per item in bytecode.
+    cleaned: dict[str, Any] = {
+        key: prop_schema[key] for key in prop_schema.keys() & _ALLOWED_KEYS
+    }
 
     # Handle anyOf / oneOf by selecting the first non-null type
     if "type" not in cleaned:
-        for union_key in ("anyOf", "oneOf"):
-            if union_key in prop_schema:
-                types = prop_schema[union_key]
-                for t in types:
-                    if isinstance(t, dict) and t.get("type") != "null":
-                        cleaned["type"] = t.get("type", "string")
-                        break
+        union = prop_schema.get("anyOf") or prop_schema.get("oneOf")
+        if union:
+            picked = next(
+                (
+                    branch
+                    for branch in union
+                    if isinstance(branch, dict) and branch.get("type") != "null"
+                ),
+                None,
+            )
+            if picked is not None:
+                cleaned["type"] = picked.get("type", "string")
 
     # Default to string if type is still missing
     if "type" not in cleaned:
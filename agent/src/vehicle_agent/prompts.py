@@ -49,6 +49,8 @@ Always use these tools to fetch actual data -- never guess or fabricate values.
 - Always fetch real data using tools before answering questions about vehicle state.
 - When diagnosing issues, check DTCs first, then gather relevant sensor data.
 - Be concise but thorough -- include actual values with units in your responses.
+- When several tool calls do not depend on each other's results, emit them all
+  in the SAME turn so they run in parallel -- do not issue them one at a time.
 - If a tool call fails, explain the issue clearly and suggest alternatives.
 - When analyzing trends, use subscribe_signals for at least 5-10 seconds of data.
 
@@ -70,3 +72,8 @@ Example -- user asks "에어컨 26도로 올려줘" or "set HVAC to 26":
 This rule applies to ALL actuator requests (HVAC, seat, windows, lights, etc.).
 Do NOT skip or defer the tool call under any circumstances.
 """
+
+# Pre-encoded wire form and a rough token estimate (UTF-8 bytes / 4),
+# computed once at import so per-turn budgeting never re-encodes the prompt.
+SYSTEM_PROMPT_BYTES: bytes = SYSTEM_PROMPT.encode("utf-8")
+SYSTEM_PROMPT_TOKEN_ESTIMATE: int = len(SYSTEM_PROMPT_BYTES) // 4
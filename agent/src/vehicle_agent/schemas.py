@@ -6,9 +6,15 @@ used by the FastAPI endpoints.
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Shared model configuration: the API models are never mutated after
+# construction, and validation errors omit the offending input value --
+# chat payloads are user text that does not belong in logged tracebacks,
+# and skipping input formatting also cheapens error construction.
+_MODEL_CONFIG = ConfigDict(frozen=True, hide_input_in_errors=True)
 
 
 class ChatMessage(BaseModel):
@@ -19,6 +25,8 @@ class ChatMessage(BaseModel):
         content: Text content of the message.
     """
 
+    model_config = _MODEL_CONFIG
+
     role: Literal["user", "assistant"] = Field(
         description="Message author: 'user' or 'assistant'",
     )
@@ -33,8 +41,11 @@ class ChatRequest(BaseModel):
     Attributes:
         message: The new user message to process.
         history: Previous conversation turns for context.
+        session_id: Optional session key for server-side history caching.
     """
 
+    model_config = _MODEL_CONFIG
+
     message: str = Field(
         description="User message to send to the agent",
     )
@@ -42,48 +53,129 @@ class ChatRequest(BaseModel):
         default_factory=list,
         description="Prior conversation turns for context",
     )
+    session_id: str | None = Field(
+        default=None,
+        description="Session key for server-side conversation caching",
+    )
 
 
-class AgentEvent(BaseModel):
-    """Server-sent event emitted during agent processing.
-
-    Each event carries a ``type`` discriminator and optional payload
-    fields depending on the event kind.
+class ToolCallEvent(BaseModel):
+    """SSE event announcing a tool invocation.
 
     Attributes:
-        type: Event discriminator.
-        name: Tool name (for tool_call events).
-        args: Tool arguments (for tool_call events).
-        result: Tool execution result (for tool_result events).
-        content: Text content (for text_chunk events).
-        message: Error description (for error events).
+        type: Event discriminator, always ``tool_call``.
+        name: Tool name being invoked.
+        args: Tool arguments.
     """
 
-    type: Literal["tool_call", "tool_result", "text_chunk", "error", "done"] = Field(
+    model_config = _MODEL_CONFIG
+
+    type: Literal["tool_call"] = Field(
         description="Event type discriminator",
     )
     name: str | None = Field(
         default=None,
-        description="Tool name (tool_call events only)",
+        description="Tool name being invoked",
     )
     args: dict[str, Any] | None = Field(
         default=None,
-        description="Tool arguments (tool_call events only)",
+        description="Tool arguments",
+    )
+
+
+class ToolResultEvent(BaseModel):
+    """SSE event carrying a tool execution result.
+
+    Attributes:
+        type: Event discriminator, always ``tool_result``.
+        name: Tool name that produced the result.
+        result: Tool execution result.
+    """
+
+    model_config = _MODEL_CONFIG
+
+    type: Literal["tool_result"] = Field(
+        description="Event type discriminator",
+    )
+    name: str | None = Field(
+        default=None,
+        description="Tool name that produced the result",
     )
     result: str | None = Field(
         default=None,
-        description="Tool execution result (tool_result events only)",
+        description="Tool execution result",
+    )
+
+
+class TextChunkEvent(BaseModel):
+    """SSE event carrying a streamed chunk of assistant text.
+
+    Attributes:
+        type: Event discriminator, always ``text_chunk``.
+        content: Text content of the chunk.
+    """
+
+    model_config = _MODEL_CONFIG
+
+    type: Literal["text_chunk"] = Field(
+        description="Event type discriminator",
     )
     content: str | None = Field(
         default=None,
-        description="Text content (text_chunk events only)",
+        description="Text content of the chunk",
+    )
+
+
+class ErrorEvent(BaseModel):
+    """SSE event reporting a processing error.
+
+    Attributes:
+        type: Event discriminator, always ``error``.
+        message: Error description.
+    """
+
+    model_config = _MODEL_CONFIG
+
+    type: Literal["error"] = Field(
+        description="Event type discriminator",
     )
     message: str | None = Field(
         default=None,
-        description="Error description (error events only)",
+        description="Error description",
     )
 
 
+class DoneEvent(BaseModel):
+    """SSE event marking the end of an agent turn.
+
+    Attributes:
+        type: Event discriminator, always ``done``.
+    """
+
+    model_config = _MODEL_CONFIG
+
+    type: Literal["done"] = Field(
+        description="Event type discriminator",
+    )
+
+
+# Discriminated union over the five SSE event shapes. The ``type`` tag
+# lets pydantic-core dispatch straight to the matching variant instead of
+# trying each union member, and every variant carries only its own
+# payload fields. These models document the SSE wire shape for API
+# consumers; the streaming path itself builds plain dicts and encodes
+# them with orjson, so no per-event validation runs while a turn is
+# streaming.
+AgentEvent = Annotated[
+    ToolCallEvent | ToolResultEvent | TextChunkEvent | ErrorEvent | DoneEvent,
+    Field(discriminator="type"),
+]
+
+# Module-level adapter so validating an incoming event dict compiles the
+# union schema once.
+AGENT_EVENT_ADAPTER: TypeAdapter[AgentEvent] = TypeAdapter(AgentEvent)
+
+
 class HealthResponse(BaseModel):
     """Health check response.
 
@@ -93,6 +185,8 @@ class HealthResponse(BaseModel):
         gemini_configured: Whether a Gemini API key is set.
     """
 
+    model_config = _MODEL_CONFIG
+
     status: str = Field(
         description="Overall service status",
     )
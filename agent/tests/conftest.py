@@ -7,6 +7,13 @@ requiring live external services.
 
 from __future__ import annotations
 
+import os
+
+# Strip the docs-URL suffix from pydantic error messages before any
+# model import; the validation-error tests build many error objects and
+# the URL lookup is pure overhead there.
+os.environ.setdefault("PYDANTIC_ERRORS_INCLUDE_URL", "0")
+
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,10 +21,13 @@ import pytest
 from vehicle_agent.config import AgentConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config() -> AgentConfig:
     """Create an AgentConfig with safe test values.
 
+    Session-scoped: the config is treated as read-only by every test, so
+    one instance serves the whole run instead of being rebuilt per test.
+
     Returns:
         AgentConfig instance with fake API key and test-friendly settings.
     """
@@ -34,42 +44,57 @@ def mock_config() -> AgentConfig:
     )
 
 
-@pytest.fixture
-def mock_mcp_bridge() -> AsyncMock:
-    """Create a mock McpBridge that is already connected with fake tools.
-
-    Returns:
-        AsyncMock with is_connected=True and a pre-populated tool list.
-    """
-    from vehicle_agent.mcp_bridge import McpBridge
-
-    bridge = AsyncMock(spec=McpBridge)
-    bridge.is_connected = True
-
-    # Pre-populated Gemini function declarations
-    bridge.get_gemini_tool_declarations.return_value = [
-        {
-            "name": "get_vehicle_signal",
-            "description": "Query a single VSS signal",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "VSS signal path"},
-                },
-                "required": ["path"],
+# Pre-populated Gemini function declarations shared by every stub bridge.
+_STUB_DECLARATIONS: list[dict] = [
+    {
+        "name": "get_vehicle_signal",
+        "description": "Query a single VSS signal",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "VSS signal path"},
             },
+            "required": ["path"],
         },
-        {
-            "name": "diagnose_dtc",
-            "description": "Retrieve active DTC codes",
-            "parameters": {"type": "object", "properties": {}},
-        },
-    ]
+    },
+    {
+        "name": "diagnose_dtc",
+        "description": "Retrieve active DTC codes",
+        "parameters": {"type": "object", "properties": {}},
+    },
+]
+
+
+class _StubBridge:
+    """Hand-written McpBridge stand-in for agent tests.
+
+    A plain class sidesteps the full-class introspection that
+    ``AsyncMock(spec=McpBridge)`` performs on every fixture invocation;
+    only ``call_tool`` stays an AsyncMock so tests can set return values
+    and assert await history.
+    """
+
+    def __init__(self) -> None:
+        self.is_connected = True
+        self.call_tool = AsyncMock(
+            return_value='{"path": "Vehicle.Speed", "value": 65.0, "unit": "km/h"}'
+        )
+
+    def get_gemini_tool_declarations(self) -> list[dict]:
+        return _STUB_DECLARATIONS
+
+    async def list_tools(self) -> list:
+        return []
 
-    bridge.call_tool.return_value = '{"path": "Vehicle.Speed", "value": 65.0, "unit": "km/h"}'
-    bridge.list_tools.return_value = []
 
-    return bridge
+@pytest.fixture
+def mock_mcp_bridge() -> _StubBridge:
+    """Create a stub McpBridge that is already connected with fake tools.
+
+    Returns:
+        _StubBridge with is_connected=True and a pre-populated tool list.
+    """
+    return _StubBridge()
 
 
 @pytest.fixture
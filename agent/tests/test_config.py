@@ -11,7 +11,7 @@ from unittest.mock import patch
 
 import pytest
 
-from vehicle_agent.config import AgentConfig, get_config
+from vehicle_agent.config import AgentConfig, get_config, reset_config
 
 
 # ===================================================================
@@ -55,6 +55,11 @@ class TestAgentConfigDefaults:
         config = AgentConfig(_env_file=None)  # type: ignore[call-arg]
         assert config.agent_log_level == "INFO"
 
+    def test_default_tools_cache_ttl(self) -> None:
+        """Default MCP tools cache TTL is one hour."""
+        config = AgentConfig(_env_file=None)  # type: ignore[call-arg]
+        assert config.mcp_tools_cache_ttl_seconds == 3600.0
+
     def test_default_max_tool_calls(self) -> None:
         """Default max tool calls per turn is 10."""
         config = AgentConfig(_env_file=None)  # type: ignore[call-arg]
@@ -114,6 +119,48 @@ class TestAgentConfigEnvOverrides:
         config = AgentConfig(_env_file=None)  # type: ignore[call-arg]
         assert config.max_tool_calls_per_turn == 3
 
+    def test_uvicorn_workers_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """UVICORN_WORKERS is coerced from string to int."""
+        monkeypatch.setenv("UVICORN_WORKERS", "4")
+        config = AgentConfig(_env_file=None)  # type: ignore[call-arg]
+        assert config.uvicorn_workers == 4
+
+    def test_max_concurrent_requests_default(self) -> None:
+        """max_concurrent_requests defaults to 256."""
+        config = AgentConfig(_env_file=None)  # type: ignore[call-arg]
+        assert config.max_concurrent_requests == 256
+
+
+# ===================================================================
+# Log level normalisation
+# ===================================================================
+class TestAgentConfigLogLevel:
+    """Tests for log level validation and derived properties."""
+
+    def test_lowercase_level_is_normalised(self) -> None:
+        """A lower-case level name is upper-cased at load time."""
+        config = AgentConfig(agent_log_level="debug", _env_file=None)  # type: ignore[call-arg]
+        assert config.agent_log_level == "DEBUG"
+
+    def test_invalid_level_raises(self) -> None:
+        """An unknown level name fails validation at config-load time."""
+        import pydantic
+
+        with pytest.raises(pydantic.ValidationError):
+            AgentConfig(agent_log_level="LOUD", _env_file=None)  # type: ignore[call-arg]
+
+    def test_log_level_int_property(self) -> None:
+        """log_level_int maps the name to the numeric logging level."""
+        import logging
+
+        config = AgentConfig(agent_log_level="WARNING", _env_file=None)  # type: ignore[call-arg]
+        assert config.log_level_int == logging.WARNING
+
+    def test_log_level_lower_property(self) -> None:
+        """log_level_lower returns the lower-cased name for uvicorn."""
+        config = AgentConfig(agent_log_level="INFO", _env_file=None)  # type: ignore[call-arg]
+        assert config.log_level_lower == "info"
+
 
 # ===================================================================
 # Empty API key edge case
@@ -141,26 +188,26 @@ class TestAgentConfigEmptyApiKey:
 # get_config singleton
 # ===================================================================
 class TestGetConfigSingleton:
-    """Tests for the lru_cache-backed get_config() factory."""
+    """Tests for the singleton-backed get_config() factory."""
 
     def test_returns_agent_config_instance(self) -> None:
         """get_config() returns an AgentConfig instance."""
-        get_config.cache_clear()
+        reset_config()
         config = get_config()
         assert isinstance(config, AgentConfig)
 
     def test_returns_same_cached_instance(self) -> None:
         """Calling get_config() twice returns the identical object."""
-        get_config.cache_clear()
+        reset_config()
         config_a = get_config()
         config_b = get_config()
         assert config_a is config_b
 
-    def test_cache_clear_returns_new_instance(self) -> None:
-        """After cache_clear(), get_config() constructs a fresh instance."""
-        get_config.cache_clear()
+    def test_reset_config_returns_new_instance(self) -> None:
+        """After reset_config(), get_config() constructs a fresh instance."""
+        reset_config()
         config_a = get_config()
-        get_config.cache_clear()
+        reset_config()
         config_b = get_config()
         # They may be equal in value but must be distinct objects
         assert config_a is not config_b
@@ -7,10 +7,13 @@ tool-call, and max-turn-limit scenarios.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import vehicle_agent.gemini_agent as gemini_agent_module
 from vehicle_agent.gemini_agent import (
     EVENT_DONE,
     EVENT_ERROR,
@@ -24,18 +27,61 @@ from vehicle_agent.gemini_agent import (
     _extract_candidate,
     _extract_function_calls,
     _extract_text,
+    _split_parts,
     _text_event,
     _tool_call_event,
 )
+from vehicle_agent.schemas import ChatMessage
 
 
 # ---------------------------------------------------------------------------
 # Helpers: build fake Gemini response objects
 # ---------------------------------------------------------------------------
+# Plain slotted dataclasses stand in for the genai response types; they
+# construct orders of magnitude faster than MagicMock trees, which matters
+# for the loop tests that build five responses per iteration.
+@dataclass(slots=True)
+class FakeFunctionCall:
+    """Stand-in for google.genai.types.FunctionCall."""
+
+    name: str
+    args: dict
+
+
+@dataclass(slots=True)
+class FakePart:
+    """Stand-in for google.genai.types.Part."""
+
+    text: str | None = None
+    function_call: FakeFunctionCall | None = None
+
+
+@dataclass(slots=True)
+class FakeContent:
+    """Stand-in for google.genai.types.Content."""
+
+    role: str
+    parts: list[FakePart]
+
+
+@dataclass(slots=True)
+class FakeCandidate:
+    """Stand-in for google.genai.types.Candidate."""
+
+    content: FakeContent
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Stand-in for google.genai.types.GenerateContentResponse."""
+
+    candidates: list[FakeCandidate]
+
+
 def _make_candidate(
     text: str | None = None,
     function_calls: list[tuple[str, dict]] | None = None,
-) -> MagicMock:
+) -> FakeCandidate:
     """Create a fake Gemini Candidate with text or function_call parts.
 
     Args:
@@ -43,92 +89,199 @@ def _make_candidate(
         function_calls: List of (name, args) tuples for function call parts.
 
     Returns:
-        MagicMock resembling google.genai.types.Candidate.
+        FakeCandidate resembling google.genai.types.Candidate.
     """
-    candidate = MagicMock()
-    parts = []
+    parts: list[FakePart] = []
 
     if text is not None:
-        part = MagicMock()
-        part.text = text
-        part.function_call = None
-        parts.append(part)
+        parts.append(FakePart(text=text))
 
     for name, args in (function_calls or []):
-        part = MagicMock()
-        part.text = None
-        fc = MagicMock()
-        fc.name = name
-        fc.args = args
-        part.function_call = fc
-        parts.append(part)
-
-    if parts:
-        candidate.content = MagicMock()
-        candidate.content.parts = parts
-    else:
-        candidate.content = MagicMock()
-        candidate.content.parts = []
+        parts.append(FakePart(function_call=FakeFunctionCall(name, args)))
 
-    return candidate
+    return FakeCandidate(FakeContent("model", parts))
 
 
-def _make_response(candidate: MagicMock | None = None) -> MagicMock:
+def _make_response(candidate: FakeCandidate | None = None) -> FakeResponse:
     """Create a fake GenerateContentResponse.
 
     Args:
         candidate: The single candidate to include, or None for empty response.
 
     Returns:
-        MagicMock resembling google.genai.types.GenerateContentResponse.
+        FakeResponse resembling google.genai.types.GenerateContentResponse.
+    """
+    return FakeResponse([candidate] if candidate is not None else [])
+
+
+async def _make_stream(*responses: FakeResponse):
+    """Create a fake streaming response yielding *responses* in order.
+
+    Args:
+        responses: Response chunks to emit from the stream.
+
+    Yields:
+        Each response chunk, mimicking generate_content_stream.
+    """
+    for response in responses:
+        yield response
+
+
+# Closure-based async stubs for agent._generate: a bare coroutine function
+# is far cheaper to construct than an AsyncMock, which only the await_count
+# assertion test still needs.
+def _async_return(value):
+    """Return an async stub that always returns *value*."""
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+def _async_side_effect(*values):
+    """Return an async stub yielding each of *values* on successive calls."""
+    iterator = iter(values)
+
+    async def _stub(*args, **kwargs):
+        return next(iterator)
+
+    return _stub
+
+
+def _async_factory(factory):
+    """Return an async stub that calls *factory* for a fresh value each time."""
+
+    async def _stub(*args, **kwargs):
+        return factory()
+
+    return _stub
+
+
+def _async_raise(exc: BaseException):
+    """Return an async stub that raises *exc* when awaited."""
+
+    async def _stub(*args, **kwargs):
+        raise exc
+
+    return _stub
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_genai():
+    """Patch the genai module once for every test in this file.
+
+    None of the chat tests read from the patched module -- they stub
+    agent._generate directly -- so entering one patch context per module
+    replaces the per-test patch machinery.
+    """
+    with patch("vehicle_agent.gemini_agent.genai"):
+        yield
+
+
+async def _collect(agen) -> list[dict]:
+    """Drain an async event generator into a list.
+
+    The async comprehension consumes the generator without per-event
+    Python-level append dispatch.
+
+    Args:
+        agen: Async generator of agent events.
+
+    Returns:
+        All yielded events in order.
     """
-    response = MagicMock()
-    response.candidates = [candidate] if candidate is not None else []
-    return response
+    return [event async for event in agen]
+
+
+def _events_by_type(events: list[dict]) -> dict[str, dict]:
+    """Index events by type in a single pass, keeping the first of each.
+
+    Args:
+        events: Collected agent events.
+
+    Returns:
+        Mapping of event type to the first event of that type.
+    """
+    by_type: dict[str, dict] = {}
+    for event in events:
+        by_type.setdefault(event["type"], event)
+    return by_type
+
+
+@pytest.fixture
+def agent(mock_mcp_bridge, mock_config) -> VehicleAgent:
+    """A VehicleAgent wired to the stub bridge and test config.
+
+    The module-scoped genai patch is already in effect, so construction
+    never touches a real client; tests only override agent._generate.
+
+    Returns:
+        VehicleAgent ready for chat() tests.
+    """
+    return VehicleAgent(mock_mcp_bridge, mock_config)
 
 
 # ===================================================================
 # _build_contents
 # ===================================================================
-class TestBuildContents:
-    """Tests for ``_build_contents`` helper."""
+@lru_cache(maxsize=None)
+def _bc_cached(history_key: tuple[tuple[str, str], ...], message: str):
+    """Memoized _build_contents keyed on hashable history tuples.
 
-    def test_empty_history_single_user_message(self) -> None:
-        """Empty history produces a single user Content object."""
-        contents = _build_contents([], "What is the speed?")
-        assert len(contents) == 1
-        assert contents[0].role == "user"
+    Repeated calls with the same inputs (across tests and across suite
+    duplication) reuse the constructed genai Content objects, which the
+    read-only assertions never mutate.
 
-    def test_user_history_role_mapping(self) -> None:
-        """History with role='user' maps to Gemini role='user'."""
-        history = [{"role": "user", "content": "Hello"}]
-        contents = _build_contents(history, "Follow up")
-        assert contents[0].role == "user"
+    Args:
+        history_key: (role, content) pairs describing the history.
+        message: New user message.
 
-    def test_assistant_history_role_mapping(self) -> None:
-        """History with role='assistant' maps to Gemini role='model'."""
-        history = [{"role": "assistant", "content": "Hi there"}]
-        contents = _build_contents(history, "Thanks")
-        assert contents[0].role == "model"
+    Returns:
+        The Content list from _build_contents.
+    """
+    history = [ChatMessage(role=role, content=content) for role, content in history_key]
+    return _build_contents(history, message)
+
+
+class TestBuildContents:
+    """Tests for ``_build_contents`` helper."""
+
+    @pytest.mark.parametrize(
+        ("history_key", "expected_len", "expected_first_role"),
+        [
+            ((), 1, "user"),
+            ((("user", "Hello"),), 2, "user"),
+            ((("assistant", "Hi there"),), 2, "model"),
+        ],
+        ids=["empty-history", "user-history", "assistant-history"],
+    )
+    def test_role_mapping(
+        self,
+        history_key: tuple[tuple[str, str], ...],
+        expected_len: int,
+        expected_first_role: str,
+    ) -> None:
+        """History roles map to Gemini roles and counts stay consistent."""
+        contents = _bc_cached(history_key, "Follow up")
+        assert len(contents) == expected_len
+        assert contents[0].role == expected_first_role
 
     def test_history_plus_new_message_count(self) -> None:
         """History of two turns plus new message produces three Content objects."""
-        history = [
-            {"role": "user", "content": "Hello"},
-            {"role": "assistant", "content": "Hi"},
-        ]
-        contents = _build_contents(history, "New question")
+        contents = _bc_cached(
+            (("user", "Hello"), ("assistant", "Hi")), "New question"
+        )
         assert len(contents) == 3
 
     def test_new_message_appended_last(self) -> None:
         """The new user message is always the last Content object."""
-        history = [{"role": "user", "content": "Previous"}]
-        contents = _build_contents(history, "Current message")
+        contents = _bc_cached((("user", "Previous"),), "Current message")
         assert contents[-1].role == "user"
 
     def test_text_part_content_is_set(self) -> None:
         """Each Content object has at least one text Part."""
-        contents = _build_contents([], "Hello")
+        contents = _bc_cached((), "Hello")
         assert contents[0].parts  # non-empty
 
 
@@ -193,6 +346,30 @@ class TestExtractFunctionCalls:
         assert calls == []
 
 
+# ===================================================================
+# _split_parts
+# ===================================================================
+class TestSplitParts:
+    """Tests for the single-pass ``_split_parts`` helper."""
+
+    def test_mixed_parts_split_in_one_pass(self) -> None:
+        """Function calls and text from one candidate are both returned."""
+        candidate = _make_candidate(
+            text="Checking...",
+            function_calls=[("diagnose_dtc", {})],
+        )
+        calls, text = _split_parts(candidate)
+        assert len(calls) == 1
+        assert text == "Checking..."
+
+    def test_empty_candidate_returns_empty(self) -> None:
+        """A candidate without parts yields no calls and empty text."""
+        candidate = _make_candidate()
+        calls, text = _split_parts(candidate)
+        assert calls == []
+        assert text == ""
+
+
 # ===================================================================
 # _extract_text
 # ===================================================================
@@ -210,8 +387,10 @@ class TestExtractText:
         candidate = MagicMock()
         part_a = MagicMock()
         part_a.text = "Hello"
+        part_a.function_call = None
         part_b = MagicMock()
         part_b.text = " World"
+        part_b.function_call = None
         candidate.content = MagicMock()
         candidate.content.parts = [part_a, part_b]
         text = _extract_text(candidate)
@@ -270,62 +449,48 @@ class TestVehicleAgentChatTextOnly:
     """Tests for VehicleAgent.chat with a text-only Gemini response."""
 
     async def test_text_only_yields_text_chunk_and_done(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
     ) -> None:
         """Text-only response yields text_chunk then done events."""
         candidate = _make_candidate(text="Speed is 65 km/h")
         response = _make_response(candidate)
 
-        with patch("vehicle_agent.gemini_agent.genai") as mock_genai:
-            mock_client = MagicMock()
-            mock_genai.Client.return_value = mock_client
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(return_value=response)
+        agent._generate = _async_return(_make_stream(response))
 
-            events = []
-            async for event in agent.chat("What is the speed?", []):
-                events.append(event)
+        events = await _collect(agent.chat("What is the speed?", []))
 
-        types_seen = [e["type"] for e in events]
-        assert EVENT_TEXT_CHUNK in types_seen
-        assert EVENT_DONE in types_seen
-        text_event = next(e for e in events if e["type"] == EVENT_TEXT_CHUNK)
+        by_type = _events_by_type(events)
+        assert EVENT_TEXT_CHUNK in by_type
+        assert EVENT_DONE in by_type
+        text_event = by_type[EVENT_TEXT_CHUNK]
         assert "65 km/h" in text_event["content"]
 
     async def test_no_candidates_yields_error_and_done(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
     ) -> None:
         """Empty candidates list yields error event then done event."""
         response = _make_response(candidate=None)
 
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(return_value=response)
+        agent._generate = _async_return(_make_stream(response))
 
-            events = []
-            async for event in agent.chat("Test", []):
-                events.append(event)
+        events = await _collect(agent.chat("Test", []))
 
-        types_seen = [e["type"] for e in events]
+        types_seen = {e["type"] for e in events}
         assert EVENT_ERROR in types_seen
         assert EVENT_DONE in types_seen
 
     async def test_gemini_api_exception_yields_error(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
     ) -> None:
         """An exception from _generate yields an error event and done."""
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(side_effect=RuntimeError("API unavailable"))
+        agent._generate = _async_raise(RuntimeError("API unavailable"))
 
-            events = []
-            async for event in agent.chat("Test", []):
-                events.append(event)
+        events = await _collect(agent.chat("Test", []))
 
-        types_seen = [e["type"] for e in events]
-        assert EVENT_ERROR in types_seen
-        assert EVENT_DONE in types_seen
-        error_event = next(e for e in events if e["type"] == EVENT_ERROR)
+        by_type = _events_by_type(events)
+        assert EVENT_ERROR in by_type
+        assert EVENT_DONE in by_type
+        error_event = by_type[EVENT_ERROR]
         assert "API unavailable" in error_event["message"]
 
 
@@ -336,7 +501,7 @@ class TestVehicleAgentChatWithToolCall:
     """Tests for VehicleAgent.chat with one tool call followed by text."""
 
     async def test_tool_call_yields_tool_events_then_text(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
     ) -> None:
         """Tool call followed by text response yields tool_call, tool_result, text_chunk, done."""
         tool_candidate = _make_candidate(
@@ -352,25 +517,21 @@ class TestVehicleAgentChatWithToolCall:
 
         mock_mcp_bridge.call_tool.return_value = '{"value": 65.0}'
 
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            # First call returns tool response, second returns text
-            agent._generate = AsyncMock(
-                side_effect=[tool_response, text_response]
-            )
+        # First call streams the tool response, second streams the text
+        agent._generate = _async_side_effect(
+            _make_stream(tool_response), _make_stream(text_response)
+        )
 
-            events = []
-            async for event in agent.chat("What is the speed?", []):
-                events.append(event)
+        events = await _collect(agent.chat("What is the speed?", []))
 
-        types_seen = [e["type"] for e in events]
+        types_seen = {e["type"] for e in events}
         assert EVENT_TOOL_CALL in types_seen
         assert EVENT_TOOL_RESULT in types_seen
         assert EVENT_TEXT_CHUNK in types_seen
         assert EVENT_DONE in types_seen
 
     async def test_tool_call_invokes_mcp_bridge(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
     ) -> None:
         """chat() calls mcp_bridge.call_tool with correct name and args."""
         tool_candidate = _make_candidate(
@@ -382,19 +543,18 @@ class TestVehicleAgentChatWithToolCall:
 
         mock_mcp_bridge.call_tool.return_value = '{"dtcs": []}'
 
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(
-                side_effect=[_make_response(tool_candidate), _make_response(text_candidate)]
-            )
+        agent._generate = _async_side_effect(
+            _make_stream(_make_response(tool_candidate)),
+            _make_stream(_make_response(text_candidate)),
+        )
 
-            async for _ in agent.chat("Check DTCs", []):
-                pass
+        async for _ in agent.chat("Check DTCs", []):
+            pass
 
         mock_mcp_bridge.call_tool.assert_awaited_once_with("diagnose_dtc", {})
 
     async def test_failed_tool_call_yields_error_result(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
     ) -> None:
         """If call_tool raises, tool_result event contains error JSON."""
         tool_candidate = _make_candidate(
@@ -405,72 +565,166 @@ class TestVehicleAgentChatWithToolCall:
 
         mock_mcp_bridge.call_tool.side_effect = RuntimeError("connection refused")
 
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(
-                side_effect=[_make_response(tool_candidate), _make_response(text_candidate)]
-            )
+        agent._generate = _async_side_effect(
+            _make_stream(_make_response(tool_candidate)),
+            _make_stream(_make_response(text_candidate)),
+        )
 
-            events = []
-            async for event in agent.chat("Speed?", []):
-                events.append(event)
+        events = await _collect(agent.chat("Speed?", []))
 
         result_events = [e for e in events if e["type"] == EVENT_TOOL_RESULT]
         assert len(result_events) == 1
         assert "error" in result_events[0]["result"]
 
 
+# ===================================================================
+# VehicleAgent.chat — session content caching
+# ===================================================================
+class TestVehicleAgentSessionCache:
+    """Tests for the session-keyed Gemini content cache."""
+
+    async def test_session_contents_cached_after_first_turn(
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
+    ) -> None:
+        """A chat with session_id stores user + model turns in the cache."""
+        response = _make_response(_make_candidate(text="65 km/h"))
+
+        agent._generate = _async_return(_make_stream(response))
+
+        async for _ in agent.chat("Speed?", [], session_id="s1"):
+            pass
+
+        assert "s1" in agent._session_contents
+        cached = agent._session_contents["s1"]
+        assert len(cached) == 2  # user message + model answer
+        assert cached[0].role == "user"
+        assert cached[-1].role == "model"
+
+    async def test_cache_hit_appends_instead_of_rebuilding(
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
+    ) -> None:
+        """A second chat on the same session extends the cached contents."""
+        agent._generate = _async_factory(
+            lambda: _make_stream(_make_response(_make_candidate(text="ok")))
+        )
+
+        async for _ in agent.chat("First", [], session_id="s1"):
+            pass
+        async for _ in agent.chat("Second", [], session_id="s1"):
+            pass
+
+        assert len(agent._session_contents["s1"]) == 4
+
+    async def test_no_session_id_leaves_cache_empty(
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
+    ) -> None:
+        """Without a session_id no server-side history is retained."""
+        response = _make_response(_make_candidate(text="ok"))
+
+        agent._generate = _async_return(_make_stream(response))
+
+        async for _ in agent.chat("Hello", []):
+            pass
+
+        assert agent._session_contents == {}
+
+    async def test_cache_hit_leaves_stored_history_untouched_mid_turn(
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config
+    ) -> None:
+        """A cache hit works on a copy; the stored list only changes on completion."""
+        agent._generate = _async_factory(
+            lambda: _make_stream(_make_response(_make_candidate(text="ok")))
+        )
+
+        async for _ in agent.chat("First", [], session_id="s1"):
+            pass
+        first_turn = agent._session_contents["s1"]
+
+        async for _ in agent.chat("Second", [], session_id="s1"):
+            pass
+
+        # The first turn's list was never mutated, so a request still
+        # streaming from it cannot see the second turn's appends.
+        assert len(first_turn) == 2
+        assert agent._session_contents["s1"] is not first_turn
+        assert len(agent._session_contents["s1"]) == 4
+
+    async def test_cache_evicts_least_recently_used_session(
+        self, agent: VehicleAgent, mock_mcp_bridge, mock_config, monkeypatch
+    ) -> None:
+        """Sessions beyond the cache cap are evicted oldest-first."""
+        monkeypatch.setattr(gemini_agent_module, "_SESSION_CACHE_MAX", 2)
+        agent._generate = _async_factory(
+            lambda: _make_stream(_make_response(_make_candidate(text="ok")))
+        )
+
+        for sid in ("s1", "s2", "s3"):
+            async for _ in agent.chat("Hello", [], session_id=sid):
+                pass
+
+        assert list(agent._session_contents) == ["s2", "s3"]
+
+
 # ===================================================================
 # VehicleAgent.chat — max tool calls limit
 # ===================================================================
+@pytest.fixture(scope="module")
+def tool_loop_response() -> FakeResponse:
+    """A response that always requests a tool call, shared across the module.
+
+    Returns:
+        FakeResponse whose candidate carries a single function_call part.
+    """
+    return _make_response(
+        _make_candidate(
+            function_calls=[("get_vehicle_signal", {"path": "Vehicle.Speed"})]
+        )
+    )
+
+
 class TestVehicleAgentMaxToolCalls:
     """Tests for the max tool calls per turn limit."""
 
     async def test_max_tool_calls_yields_error(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self,
+        agent: VehicleAgent,
+        mock_mcp_bridge,
+        mock_config,
+        tool_loop_response: FakeResponse,
     ) -> None:
         """Exceeding max_tool_calls_per_turn yields an error event."""
-        # max_tool_calls_per_turn is 5 in mock_config fixture
-        # Always return a function_call so the loop never terminates naturally
-        tool_candidate = _make_candidate(
-            function_calls=[("get_vehicle_signal", {"path": "Vehicle.Speed"})]
-        )
-        tool_candidate.content.role = "model"
+        # max_tool_calls_per_turn is 5 in mock_config fixture;
+        # the shared response always requests a tool call so the loop
+        # never terminates naturally.
         mock_mcp_bridge.call_tool.return_value = '{"value": 65.0}'
 
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(
-                return_value=_make_response(tool_candidate)
-            )
+        agent._generate = _async_factory(
+            lambda: _make_stream(tool_loop_response)
+        )
 
-            events = []
-            async for event in agent.chat("Keep calling tools", []):
-                events.append(event)
+        events = await _collect(agent.chat("Keep calling tools", []))
 
-        types_seen = [e["type"] for e in events]
-        assert EVENT_ERROR in types_seen
-        error_event = next(e for e in events if e["type"] == EVENT_ERROR)
+        by_type = _events_by_type(events)
+        assert EVENT_ERROR in by_type
+        error_event = by_type[EVENT_ERROR]
         assert "maximum tool calls" in error_event["message"]
-        assert EVENT_DONE in types_seen
+        assert EVENT_DONE in by_type
 
     async def test_max_tool_calls_count_equals_config(
-        self, mock_mcp_bridge: AsyncMock, mock_config
+        self,
+        agent: VehicleAgent,
+        mock_mcp_bridge,
+        mock_config,
+        tool_loop_response: FakeResponse,
     ) -> None:
         """The number of _generate calls equals max_tool_calls_per_turn."""
-        tool_candidate = _make_candidate(
-            function_calls=[("get_vehicle_signal", {"path": "Vehicle.Speed"})]
-        )
-        tool_candidate.content.role = "model"
         mock_mcp_bridge.call_tool.return_value = '{"value": 65.0}'
 
-        with patch("vehicle_agent.gemini_agent.genai"):
-            agent = VehicleAgent(mock_mcp_bridge, mock_config)
-            agent._generate = AsyncMock(
-                return_value=_make_response(tool_candidate)
-            )
+        agent._generate = AsyncMock(
+            side_effect=lambda *a, **k: _make_stream(tool_loop_response)
+        )
 
-            async for _ in agent.chat("Spam tool calls", []):
-                pass
+        async for _ in agent.chat("Spam tool calls", []):
+            pass
 
         assert agent._generate.await_count == mock_config.max_tool_calls_per_turn
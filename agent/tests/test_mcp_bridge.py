@@ -1,7 +1,7 @@
 """Unit tests for the McpBridge and schema-conversion helpers.
 
 Tests cover MCP-to-Gemini schema translation, property schema cleaning,
-the is_connected property, subprocess environment building, and guard
+the is_connected flag, subprocess environment building, and guard
 conditions for un-cached tool declarations.
 """
 
@@ -231,49 +231,165 @@ class TestCleanPropertySchema:
         assert cleaned["type"] == "string"
 
 
+# Opaque stand-in for tests that only need "session is not None";
+# object() is far cheaper to construct than a MagicMock.
+_SESSION_SENTINEL = object()
+
+
 # ===================================================================
 # McpBridge.is_connected
 # ===================================================================
 class TestMcpBridgeIsConnected:
-    """Tests for the McpBridge.is_connected property."""
+    """Tests for the McpBridge.is_connected flag."""
 
     def test_not_connected_by_default(self, mock_config: AgentConfig) -> None:
         """A freshly created McpBridge reports is_connected=False."""
         bridge = McpBridge(mock_config)
         assert bridge.is_connected is False
 
-    def test_connected_requires_both_flags(self, mock_config: AgentConfig) -> None:
-        """is_connected requires _connected=True AND _session is not None."""
+    def test_flag_alone_does_not_pass_session_guard(
+        self, mock_config: AgentConfig
+    ) -> None:
+        """_ensure_session still requires a live session besides the flag."""
         bridge = McpBridge(mock_config)
-        bridge._connected = True
-        # _session is still None, so is_connected should be False
-        assert bridge.is_connected is False
+        bridge.is_connected = True
+        # _session is still None, so the guard must reject tool calls.
+        with pytest.raises(McpBridgeError):
+            bridge._ensure_session()
 
     def test_connected_when_session_and_flag_set(
         self, mock_config: AgentConfig
     ) -> None:
-        """is_connected returns True when both _connected and _session are set."""
+        """The guard passes when both the flag and a session are set."""
         bridge = McpBridge(mock_config)
-        bridge._connected = True
-        bridge._session = MagicMock()  # type: ignore[assignment]
+        bridge.is_connected = True
+        bridge._session = _SESSION_SENTINEL  # type: ignore[assignment]
         assert bridge.is_connected is True
+        bridge._ensure_session()
+
+
+# ===================================================================
+# McpBridge.call_tool — in-flight dedup
+# ===================================================================
+class TestCallToolDedup:
+    """Tests for coalescing concurrent duplicate idempotent tool calls."""
+
+    @staticmethod
+    def _connect_stub_session(bridge: McpBridge, session: MagicMock) -> None:
+        """Mark *bridge* connected with *session* as its MCP session."""
+        bridge.is_connected = True
+        bridge._session = session  # type: ignore[assignment]
+
+    async def test_duplicate_reads_share_one_round_trip(
+        self, mock_config: AgentConfig
+    ) -> None:
+        """Two concurrent identical read calls issue one session call."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        bridge = McpBridge(mock_config)
+        session = MagicMock()
+        part = MagicMock()
+        part.text = "65.0"
+
+        async def slow_call(*args: object, **kwargs: object) -> MagicMock:
+            # Yield to the loop so the duplicate call overlaps in flight.
+            await asyncio.sleep(0)
+            return MagicMock(content=[part])
+
+        session.call_tool = AsyncMock(side_effect=slow_call)
+        self._connect_stub_session(bridge, session)
+
+        results = await asyncio.gather(
+            bridge.call_tool("get_vehicle_signal", {"path": "Vehicle.Speed"}),
+            bridge.call_tool("get_vehicle_signal", {"path": "Vehicle.Speed"}),
+        )
+        assert results == ["65.0", "65.0"]
+        assert session.call_tool.await_count == 1
+
+    async def test_cancelled_waiter_does_not_abort_shared_call(
+        self, mock_config: AgentConfig
+    ) -> None:
+        """Cancelling one coalesced caller leaves the other's result intact."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        bridge = McpBridge(mock_config)
+        session = MagicMock()
+        part = MagicMock()
+        part.text = "65.0"
+        started = asyncio.Event()
+
+        async def slow_call(*args: object, **kwargs: object) -> MagicMock:
+            started.set()
+            await asyncio.sleep(0.01)
+            return MagicMock(content=[part])
+
+        session.call_tool = AsyncMock(side_effect=slow_call)
+        self._connect_stub_session(bridge, session)
+
+        args = {"path": "Vehicle.Speed"}
+        first = asyncio.ensure_future(bridge.call_tool("get_vehicle_signal", args))
+        await started.wait()
+        second = asyncio.ensure_future(bridge.call_tool("get_vehicle_signal", args))
+        await asyncio.sleep(0)
+
+        # Simulate the first caller's client disconnecting mid-flight.
+        first.cancel()
+        assert await second == "65.0"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert session.call_tool.await_count == 1
+
+    async def test_write_tools_are_never_coalesced(
+        self, mock_config: AgentConfig
+    ) -> None:
+        """set_actuator calls always dispatch individually."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        bridge = McpBridge(mock_config)
+        session = MagicMock()
+        part = MagicMock()
+        part.text = "ok"
+        session.call_tool = AsyncMock(return_value=MagicMock(content=[part]))
+        self._connect_stub_session(bridge, session)
+
+        args = {"path": "Vehicle.Cabin.HVAC", "value": 26.0}
+        await asyncio.gather(
+            bridge.call_tool("set_actuator", args),
+            bridge.call_tool("set_actuator", args),
+        )
+        assert session.call_tool.await_count == 2
 
 
 # ===================================================================
 # McpBridge._build_subprocess_env
 # ===================================================================
+@pytest.fixture(scope="class")
+def bridge(mock_config: AgentConfig) -> McpBridge:
+    """One bridge shared by a class's read-only assertions.
+
+    Tests that rely on a cold env cache (or mutate bridge state)
+    construct their own instance instead.
+    """
+    return McpBridge(mock_config)
+
+
 class TestMcpBridgeBuildSubprocessEnv:
     """Tests for McpBridge._build_subprocess_env."""
 
-    def test_includes_kuksa_host(self, mock_config: AgentConfig) -> None:
+    def test_includes_kuksa_host(
+        self, bridge: McpBridge, mock_config: AgentConfig
+    ) -> None:
         """Subprocess env includes KUKSA_DATABROKER_HOST from config."""
-        bridge = McpBridge(mock_config)
         env = bridge._build_subprocess_env()
         assert env["KUKSA_DATABROKER_HOST"] == mock_config.kuksa_databroker_host
 
-    def test_includes_kuksa_port_as_string(self, mock_config: AgentConfig) -> None:
+    def test_includes_kuksa_port_as_string(
+        self, bridge: McpBridge, mock_config: AgentConfig
+    ) -> None:
         """Subprocess env includes KUKSA_DATABROKER_PORT as a string."""
-        bridge = McpBridge(mock_config)
         env = bridge._build_subprocess_env()
         assert env["KUKSA_DATABROKER_PORT"] == str(mock_config.kuksa_databroker_port)
 
@@ -325,3 +441,14 @@ class TestGetGeminiToolDeclarations:
         declarations = bridge.get_gemini_tool_declarations()
         assert len(declarations) == 1
         assert declarations[0]["name"] == "diagnose_dtc"
+
+    def test_invalidate_tools_clears_caches(self, mock_config: AgentConfig) -> None:
+        """invalidate_tools drops both the tool and declaration caches."""
+        bridge = McpBridge(mock_config)
+        bridge._tools_cache = [_make_mcp_tool()]  # type: ignore[list-item]
+        bridge.get_gemini_tool_declarations()
+
+        bridge.invalidate_tools()
+        assert bridge._tools_cache is None
+        assert bridge._tools_cached_at is None
+        assert bridge._gemini_declarations_cache is None
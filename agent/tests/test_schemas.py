@@ -9,7 +9,17 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
-from vehicle_agent.schemas import AgentEvent, ChatMessage, ChatRequest, HealthResponse
+from vehicle_agent.schemas import (
+    AGENT_EVENT_ADAPTER,
+    ChatMessage,
+    ChatRequest,
+    DoneEvent,
+    ErrorEvent,
+    HealthResponse,
+    TextChunkEvent,
+    ToolCallEvent,
+    ToolResultEvent,
+)
 
 
 # ===================================================================
@@ -79,6 +89,16 @@ class TestChatRequest:
         with pytest.raises(ValidationError):
             ChatRequest()  # type: ignore[call-arg]
 
+    def test_session_id_defaults_to_none(self) -> None:
+        """ChatRequest without session_id defaults to None."""
+        req = ChatRequest(message="Hello")
+        assert req.session_id is None
+
+    def test_session_id_is_stored(self) -> None:
+        """ChatRequest stores a provided session_id."""
+        req = ChatRequest(message="Hello", session_id="abc-123")
+        assert req.session_id == "abc-123"
+
     def test_explicit_empty_history(self) -> None:
         """ChatRequest with explicit empty history list stores empty list."""
         req = ChatRequest(message="test", history=[])
@@ -89,11 +109,11 @@ class TestChatRequest:
 # AgentEvent
 # ===================================================================
 class TestAgentEvent:
-    """Tests for the AgentEvent server-sent event model."""
+    """Tests for the AgentEvent discriminated union of SSE event models."""
 
     def test_tool_call_event(self) -> None:
         """tool_call event stores name and args."""
-        event = AgentEvent(
+        event = ToolCallEvent(
             type="tool_call",
             name="get_vehicle_signal",
             args={"path": "Vehicle.Speed"},
@@ -104,7 +124,7 @@ class TestAgentEvent:
 
     def test_tool_result_event(self) -> None:
         """tool_result event stores name and result."""
-        event = AgentEvent(
+        event = ToolResultEvent(
             type="tool_result",
             name="get_vehicle_signal",
             result='{"value": 65.0}',
@@ -114,48 +134,50 @@ class TestAgentEvent:
 
     def test_text_chunk_event(self) -> None:
         """text_chunk event stores content field."""
-        event = AgentEvent(type="text_chunk", content="The current speed is 65 km/h.")
+        event = TextChunkEvent(type="text_chunk", content="The current speed is 65 km/h.")
         assert event.type == "text_chunk"
         assert event.content == "The current speed is 65 km/h."
 
     def test_error_event(self) -> None:
         """error event stores message field."""
-        event = AgentEvent(type="error", message="Gemini API unavailable")
+        event = ErrorEvent(type="error", message="Gemini API unavailable")
         assert event.type == "error"
         assert event.message == "Gemini API unavailable"
 
     def test_done_event(self) -> None:
-        """done event requires only the type field."""
-        event = AgentEvent(type="done")
+        """done event carries only the type field."""
+        event = DoneEvent(type="done")
         assert event.type == "done"
-        assert event.name is None
-        assert event.args is None
-        assert event.result is None
-        assert event.content is None
-        assert event.message is None
+        assert event.model_dump() == {"type": "done"}
 
     def test_invalid_type_raises_validation_error(self) -> None:
-        """AgentEvent with an unrecognised type raises ValidationError."""
+        """An unrecognised type tag matches no variant and raises."""
         with pytest.raises(ValidationError):
-            AgentEvent(type="unknown_type")  # type: ignore[arg-type]
+            AGENT_EVENT_ADAPTER.validate_python({"type": "unknown_type"})
 
     @pytest.mark.parametrize(
-        "event_type",
-        ["tool_call", "tool_result", "text_chunk", "error", "done"],
+        ("event_type", "expected_cls"),
+        [
+            ("tool_call", ToolCallEvent),
+            ("tool_result", ToolResultEvent),
+            ("text_chunk", TextChunkEvent),
+            ("error", ErrorEvent),
+            ("done", DoneEvent),
+        ],
     )
-    def test_all_valid_types_accepted(self, event_type: str) -> None:
-        """All documented event types are accepted by AgentEvent."""
-        event = AgentEvent(type=event_type)  # type: ignore[arg-type]
+    def test_all_valid_types_dispatch_to_variant(
+        self, event_type: str, expected_cls: type
+    ) -> None:
+        """Each documented type tag dispatches to its own event model."""
+        event = AGENT_EVENT_ADAPTER.validate_python({"type": event_type})
+        assert isinstance(event, expected_cls)
         assert event.type == event_type
 
     def test_optional_fields_default_to_none(self) -> None:
-        """Unspecified optional fields default to None."""
-        event = AgentEvent(type="done")
+        """Unspecified payload fields default to None on each variant."""
+        event = ToolCallEvent(type="tool_call")
         assert event.name is None
         assert event.args is None
-        assert event.result is None
-        assert event.content is None
-        assert event.message is None
 
 
 # ===================================================================
@@ -0,0 +1,64 @@
+"""Shared fixtures for the DBC script tests.
+
+Parsing a DBC file dominates this suite's runtime, so the database
+fixtures are session-scoped: each DBC is parsed exactly once per run and
+shared read-only across test classes.
+"""
+
+from pathlib import Path
+
+import cantools
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+HYUNDAI_DBC = SCRIPT_DIR.parent / "hyundai_kia" / "hyundai_kia_generic.dbc"
+TESLA_DBC = SCRIPT_DIR.parent / "tesla_model3" / "tesla_model3.dbc"
+
+
+@pytest.fixture(scope="session")
+def hyundai_db() -> cantools.database.Database:
+    """Loaded Hyundai/Kia DBC database, parsed once per session."""
+    return cantools.database.load_file(str(HYUNDAI_DBC))
+
+
+@pytest.fixture(scope="session")
+def tesla_db() -> cantools.database.Database:
+    """Loaded Tesla Model 3 DBC database, parsed once per session."""
+    return cantools.database.load_file(str(TESLA_DBC))
+
+
+@pytest.fixture(scope="session", params=["hyundai", "tesla"])
+def db(request: pytest.FixtureRequest) -> cantools.database.Database:
+    """Parametrized view over both DBC databases.
+
+    Indirects through the per-DBC session fixtures, so tests that run
+    against both databases still share the single parse of each.
+    """
+    return request.getfixturevalue(f"{request.param}_db")
+
+
+@pytest.fixture(scope="session")
+def db_tables(
+    db: cantools.database.Database,
+) -> tuple[dict, dict]:
+    """Precomputed lookup tables for the parametrized database.
+
+    Returns:
+        Tuple of (id_to_msg, bounds_by_id): frame ID to Message, and
+        frame ID to a tuple of (signal name, lower, upper) bounds as
+        plain floats, so per-frame decode loops compare primitives
+        instead of re-reading Signal attributes.
+    """
+    id_to_msg = {m.frame_id: m for m in db.messages}
+    bounds_by_id = {
+        m.frame_id: tuple(
+            (
+                sig.name,
+                float(sig.minimum) if sig.minimum is not None else float("-inf"),
+                float(sig.maximum) if sig.maximum is not None else float("inf"),
+            )
+            for sig in m.signals
+        )
+        for m in db.messages
+    }
+    return id_to_msg, bounds_by_id
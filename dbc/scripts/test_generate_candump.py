@@ -21,14 +21,6 @@ from generate_candump import (
     _normalise_name,
 )
 
-# ---------------------------------------------------------------------------
-# Paths
-# ---------------------------------------------------------------------------
-
-SCRIPT_DIR = Path(__file__).resolve().parent
-HYUNDAI_DBC = SCRIPT_DIR.parent / "hyundai_kia" / "hyundai_kia_generic.dbc"
-TESLA_DBC = SCRIPT_DIR.parent / "tesla_model3" / "tesla_model3.dbc"
-
 # Compiled pattern for the candump log line format:
 #   (<unix_ts>) <interface> <CAN_ID_HEX>#<DATA_HEX>
 # Example: (1706000000.123456) vcan0 100#9817FF8B00000000
@@ -166,16 +158,6 @@ class TestBuildSignalGenerator:
         """Seeded Random instance for reproducible generator behaviour."""
         return random.Random(42)
 
-    @pytest.fixture
-    def hyundai_db(self) -> cantools.database.Database:
-        """Loaded Hyundai/Kia DBC database."""
-        return cantools.database.load_file(str(HYUNDAI_DBC))
-
-    @pytest.fixture
-    def tesla_db(self) -> cantools.database.Database:
-        """Loaded Tesla Model 3 DBC database."""
-        return cantools.database.load_file(str(TESLA_DBC))
-
     def _find_signal(
         self, db: cantools.database.Database, name: str
     ) -> cantools.database.Signal:
@@ -364,23 +346,19 @@ class TestGenerateCandump:
         """Seeded Random instance for reproducible generation."""
         return random.Random(42)
 
-    @pytest.mark.parametrize("dbc_path", [HYUNDAI_DBC, TESLA_DBC], ids=["hyundai", "tesla"])
     def test_generates_nonzero_frames(
-        self, dbc_path: Path, tmp_path: Path, rng: random.Random
+        self, db: cantools.database.Database, tmp_path: Path, rng: random.Random
     ) -> None:
         """Generation with a positive duration produces at least one CAN frame."""
-        db = cantools.database.load_file(str(dbc_path))
         out = tmp_path / "test.log"
         with CandumpWriter(out) as w:
             count = generate_candump(db, w, duration=5.0, rng=rng)
         assert count > 0
 
-    @pytest.mark.parametrize("dbc_path", [HYUNDAI_DBC, TESLA_DBC], ids=["hyundai", "tesla"])
     def test_all_messages_represented(
-        self, dbc_path: Path, tmp_path: Path, rng: random.Random
+        self, db: cantools.database.Database, tmp_path: Path, rng: random.Random
     ) -> None:
         """Every DBC message has at least one frame in the output."""
-        db = cantools.database.load_file(str(dbc_path))
         out = tmp_path / "test.log"
         with CandumpWriter(out) as w:
             generate_candump(db, w, duration=5.0, rng=rng)
@@ -397,12 +375,10 @@ class TestGenerateCandump:
             f"Missing message IDs: {expected_ids - can_ids_in_output}"
         )
 
-    @pytest.mark.parametrize("dbc_path", [HYUNDAI_DBC, TESLA_DBC], ids=["hyundai", "tesla"])
     def test_all_lines_valid_format(
-        self, dbc_path: Path, tmp_path: Path, rng: random.Random
+        self, db: cantools.database.Database, tmp_path: Path, rng: random.Random
     ) -> None:
         """Every output line matches the candump log format regex."""
-        db = cantools.database.load_file(str(dbc_path))
         out = tmp_path / "test.log"
         with CandumpWriter(out) as w:
             generate_candump(db, w, duration=2.0, rng=rng)
@@ -410,79 +386,105 @@ class TestGenerateCandump:
         for line in out.read_text().strip().split("\n"):
             assert CANDUMP_LINE_PATTERN.match(line), f"Bad line: {line!r}"
 
-    def test_frame_count_matches_return_value(self, tmp_path: Path) -> None:
+    def test_frame_count_matches_return_value(
+        self, hyundai_db: cantools.database.Database, tmp_path: Path
+    ) -> None:
         """The integer returned by generate_candump matches the number of lines written."""
-        db = cantools.database.load_file(str(HYUNDAI_DBC))
         out = tmp_path / "test.log"
         rng = random.Random(0)
         with CandumpWriter(out) as w:
-            count = generate_candump(db, w, duration=3.0, rng=rng)
+            count = generate_candump(hyundai_db, w, duration=3.0, rng=rng)
 
         lines = [l for l in out.read_text().splitlines() if l.strip()]
         assert count == len(lines)
 
-    def test_deterministic_with_same_seed(self, tmp_path: Path) -> None:
+    def test_deterministic_with_same_seed(
+        self, hyundai_db: cantools.database.Database, tmp_path: Path
+    ) -> None:
         """Two runs with the same seed produce byte-identical output."""
-        db = cantools.database.load_file(str(HYUNDAI_DBC))
-
         out1 = tmp_path / "run1.log"
         with CandumpWriter(out1) as w:
-            generate_candump(db, w, duration=5.0, rng=random.Random(99))
+            generate_candump(hyundai_db, w, duration=5.0, rng=random.Random(99))
 
         out2 = tmp_path / "run2.log"
         with CandumpWriter(out2) as w:
-            generate_candump(db, w, duration=5.0, rng=random.Random(99))
+            generate_candump(hyundai_db, w, duration=5.0, rng=random.Random(99))
 
         assert out1.read_text() == out2.read_text()
 
-    def test_different_seeds_produce_different_output(self, tmp_path: Path) -> None:
+    def test_different_seeds_produce_different_output(
+        self, hyundai_db: cantools.database.Database, tmp_path: Path
+    ) -> None:
         """Two runs with different seeds produce non-identical output (with high probability)."""
-        db = cantools.database.load_file(str(HYUNDAI_DBC))
-
         out1 = tmp_path / "seed_a.log"
         with CandumpWriter(out1) as w:
-            generate_candump(db, w, duration=5.0, rng=random.Random(1))
+            generate_candump(hyundai_db, w, duration=5.0, rng=random.Random(1))
 
         out2 = tmp_path / "seed_b.log"
         with CandumpWriter(out2) as w:
-            generate_candump(db, w, duration=5.0, rng=random.Random(999))
+            generate_candump(hyundai_db, w, duration=5.0, rng=random.Random(999))
 
         assert out1.read_text() != out2.read_text()
 
-    def test_invalid_duration_zero_raises(self, tmp_path: Path) -> None:
+    def test_invalid_duration_zero_raises(
+        self, hyundai_db: cantools.database.Database, tmp_path: Path
+    ) -> None:
         """Zero duration raises ValueError mentioning 'positive'."""
-        db = cantools.database.load_file(str(HYUNDAI_DBC))
         out = tmp_path / "test.log"
         with CandumpWriter(out) as w:
             with pytest.raises(ValueError, match="positive"):
-                generate_candump(db, w, duration=0.0, rng=random.Random(42))
+                generate_candump(hyundai_db, w, duration=0.0, rng=random.Random(42))
 
-    def test_invalid_duration_negative_raises(self, tmp_path: Path) -> None:
+    def test_invalid_duration_negative_raises(
+        self, hyundai_db: cantools.database.Database, tmp_path: Path
+    ) -> None:
         """Negative duration raises ValueError mentioning 'positive'."""
-        db = cantools.database.load_file(str(HYUNDAI_DBC))
         out = tmp_path / "test.log"
         with CandumpWriter(out) as w:
             with pytest.raises(ValueError, match="positive"):
-                generate_candump(db, w, duration=-1.0, rng=random.Random(42))
+                generate_candump(hyundai_db, w, duration=-1.0, rng=random.Random(42))
 
-    def test_timestamps_are_monotonically_non_decreasing(self, tmp_path: Path) -> None:
+    def test_message_without_signals_still_emits_frames(
+        self, tmp_path: Path
+    ) -> None:
+        """A message with no signals produces zero-payload frames at its rate."""
+        db = cantools.database.load_string(
+            'VERSION ""\n'
+            "BS_:\n"
+            "BU_: ECU\n"
+            "\n"
+            "BO_ 256 EmptyMsg: 8 ECU\n",
+            "dbc",
+        )
+        out = tmp_path / "test.log"
+        with CandumpWriter(out) as w:
+            count = generate_candump(db, w, duration=1.0, rng=random.Random(42))
+
+        assert count > 0
+        lines = out.read_text().strip().split("\n")
+        assert len(lines) == count
+        for line in lines:
+            payload = line.split("#")[1]
+            assert payload == "00" * 8
+
+    def test_timestamps_are_monotonically_non_decreasing(
+        self, hyundai_db: cantools.database.Database, tmp_path: Path
+    ) -> None:
         """Timestamps in the output file are monotonically non-decreasing."""
-        db = cantools.database.load_file(str(HYUNDAI_DBC))
         out = tmp_path / "test.log"
         with CandumpWriter(out) as w:
-            generate_candump(db, w, duration=2.0, rng=random.Random(42))
+            generate_candump(hyundai_db, w, duration=2.0, rng=random.Random(42))
 
         lines = out.read_text().strip().split("\n")
         timestamps = [
             float(line.split(")")[0].lstrip("(")) for line in lines
         ]
-        # Messages are written per-message sequentially; within a single message
-        # timestamps must be non-decreasing.  Across messages they may restart,
-        # so we only validate the per-message blocks implicitly by checking that
-        # no timestamp is before the global BASE_TIMESTAMP.
         from generate_candump import BASE_TIMESTAMP
-        for ts in timestamps:
-            assert ts >= BASE_TIMESTAMP, f"Timestamp {ts} precedes BASE_TIMESTAMP"
+        assert timestamps[0] >= BASE_TIMESTAMP
+        for prev, curr in zip(timestamps, timestamps[1:]):
+            assert prev <= curr, (
+                f"Timestamp {curr} follows later timestamp {prev}"
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -493,18 +495,16 @@ class TestGenerateCandump:
 class TestDecodability:
     """Verify that generated frames can be decoded back to physically valid values."""
 
-    @pytest.mark.parametrize("dbc_path", [HYUNDAI_DBC, TESLA_DBC], ids=["hyundai", "tesla"])
     def test_frames_decodable_without_error(
-        self, dbc_path: Path, tmp_path: Path
+        self, db: cantools.database.Database, db_tables: tuple[dict, dict], tmp_path: Path
     ) -> None:
         """All generated frames decode without raising an exception."""
-        db = cantools.database.load_file(str(dbc_path))
         out = tmp_path / "test.log"
         rng = random.Random(42)
         with CandumpWriter(out) as w:
             generate_candump(db, w, duration=2.0, rng=rng)
 
-        id_to_msg = {m.frame_id: m for m in db.messages}
+        id_to_msg, _ = db_tables
 
         for line in out.read_text().strip().split("\n"):
             parts = line.split()
@@ -518,18 +518,16 @@ class TestDecodability:
             decoded = msg.decode(data)
             assert isinstance(decoded, dict)
 
-    @pytest.mark.parametrize("dbc_path", [HYUNDAI_DBC, TESLA_DBC], ids=["hyundai", "tesla"])
     def test_decoded_signal_values_within_physical_bounds(
-        self, dbc_path: Path, tmp_path: Path
+        self, db: cantools.database.Database, db_tables: tuple[dict, dict], tmp_path: Path
     ) -> None:
         """Decoded signal values are all within their DBC-defined physical bounds."""
-        db = cantools.database.load_file(str(dbc_path))
         out = tmp_path / "test.log"
         rng = random.Random(42)
         with CandumpWriter(out) as w:
             generate_candump(db, w, duration=2.0, rng=rng)
 
-        id_to_msg = {m.frame_id: m for m in db.messages}
+        id_to_msg, bounds_by_id = db_tables
 
         for line in out.read_text().strip().split("\n"):
             parts = line.split()
@@ -540,10 +538,10 @@ class TestDecodability:
             msg = id_to_msg[can_id]
             decoded = msg.decode(data)
 
-            for sig in msg.signals:
-                val = decoded[sig.name]
-                lo = float(sig.minimum) if sig.minimum is not None else float("-inf")
-                hi = float(sig.maximum) if sig.maximum is not None else float("inf")
+            # Bounds are pre-extracted as plain floats, so this hot loop
+            # does primitive comparisons instead of Signal attribute reads.
+            for name, lo, hi in bounds_by_id[can_id]:
+                val = decoded[name]
                 assert lo <= val <= hi, (
-                    f"{sig.name}: decoded {val} not in [{lo}, {hi}]"
+                    f"{name}: decoded {val} not in [{lo}, {hi}]"
                 )